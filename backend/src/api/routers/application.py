@@ -5,20 +5,14 @@ from fastapi import APIRouter, Depends, HTTPException
 from src.api.schemas import ApplicationSchema
 from src.core.apps.airflow_application import AccessEndpoint
 from src.core.apps.application_factory import ApplicationFactory
-from src.core.kubernetes.cluster_manager import ClusterManager
+from src.core.kubernetes.cluster_manager import ClusterManager, get_cluster_manager
 from src.core.utils import setup_logger
 
 router = APIRouter()
 
-cluster_manager = ClusterManager()
-
 logger = setup_logger('APIApplicationRouter')
 
 
-def get_cluster_manager() -> ClusterManager:
-    return cluster_manager
-
-
 @router.get('/applications')
 def get_applications(
     cluster_manager: Annotated[ClusterManager, Depends(get_cluster_manager)],
@@ -39,8 +33,8 @@ def get_application(
 
 
 @router.get('/applications/{application_id}/versions')
-def get_application_available_versions(application_id: int) -> list[str]:
-    return ApplicationFactory.get_application_class(application_id).get_available_versions()
+async def get_application_available_versions(application_id: int) -> list[str]:
+    return await ApplicationFactory.get_application_class(application_id).get_available_versions()
 
 
 @router.get('/applications/{application_id}/access_endpoints')
@@ -13,7 +13,7 @@ from src.api.schemas import (
 )
 from src.core.apps.base_application import AccessEndpointConfig
 from src.core.deployment_status import DeploymentStatus
-from src.core.kubernetes.cluster_manager import ClusterManager
+from src.core.kubernetes.cluster_manager import ClusterManager, get_cluster_manager
 from src.core.kubernetes.configuration import ClusterConfiguration
 from src.core.providers.provider_factory import ProviderFactory
 from src.core.utils import setup_logger
@@ -22,12 +22,6 @@ logger = setup_logger('APIClusterRouter')
 
 router = APIRouter()
 
-cluster_manager = ClusterManager()
-
-
-def get_cluster_manager() -> ClusterManager:
-    return cluster_manager
-
 
 @router.post('/clusters/', status_code=status.HTTP_202_ACCEPTED)
 async def create_cluster(
@@ -90,7 +84,7 @@ async def create_deployment(
     background_tasks: BackgroundTasks,
     cluster_manager: Annotated[ClusterManager, Depends(get_cluster_manager)],
 ) -> dict:
-    logger.debug(f'Received request to deploy app: {deployment}')
+    logger.debug('Received request to deploy app: %s', deployment)
 
     deployment_id = await cluster_manager.create_deployment_entry(cluster_id, deployment)
 
@@ -113,13 +107,13 @@ async def check_endpoint_existence(
 
 @router.post('/clusters/{cluster_id}/deployments/{deployment_id}', status_code=status.HTTP_202_ACCEPTED)
 async def update_deployment(
-    cluster_id: int | str,
-    deployment_id: int | str,
+    cluster_id: int,
+    deployment_id: int,
     deployment: DeploymentUpdateSchema,
     background_tasks: BackgroundTasks,
     cluster_manager: Annotated[ClusterManager, Depends(get_cluster_manager)],
 ) -> dict:
-    logger.debug(f'Received request to update deployment: {deployment}')
+    logger.debug('Received request to update deployment: %s', deployment)
 
     background_tasks.add_task(cluster_manager.update_deployment, cluster_id, deployment_id, deployment.config)
 
@@ -128,8 +122,8 @@ async def update_deployment(
 
 @router.delete('/clusters/{cluster_id}/deployments/{deployment_id}', status_code=status.HTTP_200_OK)
 async def delete_cluster_deployment(
-    cluster_id: int | str,
-    deployment_id: int | str,
+    cluster_id: int,
+    deployment_id: int,
     cluster_manager: Annotated[ClusterManager, Depends(get_cluster_manager)],
 ) -> None:
     await cluster_manager.remove_deployment(deployment_id)
@@ -163,20 +157,21 @@ async def get_cluster_deployment_credentials(
     return credentials
 
 
+# Shared client so repeated health checks reuse pooled connections.
+# verify=False as otherwise will fail when using cert-manager staging issuer
+_health_check_client = httpx.AsyncClient(timeout=10, verify=False)
+
+
 @router.get('/deployments/proxy-health-check')
 async def proxy_health_check(target_url: str) -> None:
-    logger.debug(f'Received proxy health check request for: {target_url}')
+    logger.debug('Received proxy health check request for: %s', target_url)
 
     try:
-        # verify=False as otherwise will fail when using cert-manager staging issuer
-        async with httpx.AsyncClient(timeout=10, verify=False) as client:
-            response = await client.get(target_url, follow_redirects=True)
+        response = await _health_check_client.get(target_url, follow_redirects=True)
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            logger.debug(
-                f'Successfully proxied health check for {target_url}. Status: {response.status_code}, {response}'
-            )
+        logger.debug('Successfully proxied health check for %s. Status: %s', target_url, response.status_code)
 
     except httpx.HTTPStatusError as e:
         logger.exception(
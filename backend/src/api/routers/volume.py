@@ -5,19 +5,13 @@ from fastapi.background import BackgroundTasks
 
 from src.api.schemas import VolumeCreateResponseSchema, VolumeCreateSchema, VolumeSchema
 from src.core.deployment_status import DeploymentStatus
-from src.core.kubernetes.cluster_manager import ClusterManager
+from src.core.kubernetes.cluster_manager import ClusterManager, get_cluster_manager
 from src.core.utils import setup_logger
 
 logger = setup_logger('APIVolumeRouter')
 
 router = APIRouter()
 
-cluster_manager = ClusterManager()
-
-
-def get_cluster_manager() -> ClusterManager:
-    return cluster_manager
-
 
 @router.get('/volumes')
 def get_volumes(cluster_manager: Annotated[ClusterManager, Depends(get_cluster_manager)]) -> list[VolumeSchema]:
@@ -43,7 +37,7 @@ async def create_volume(
     background_tasks: BackgroundTasks,
     cluster_manager: Annotated[ClusterManager, Depends(get_cluster_manager)],
 ) -> VolumeCreateResponseSchema:
-    logger.debug(f'Received request to create volume: {volume}')
+    logger.debug('Received request to create volume: %s', volume)
 
     background_tasks.add_task(cluster_manager.create_volume, volume.provider, volume)
 
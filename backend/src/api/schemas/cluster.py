@@ -19,10 +19,7 @@ class ClusterAdditionalComponents(BaseModel):
     pg_operator: PgOperator
 
     def to_dict(self) -> dict:
-        return {
-            'traefik_dashboard': self.traefik_dashboard.model_dump(),
-            'pg_operator': self.pg_operator.model_dump(),
-        }
+        return self.model_dump()
 
 
 class NodePoolAutoscalingConfig(BaseModel):
@@ -35,7 +32,7 @@ class NodePoolAutoscalingConfig(BaseModel):
         return self.max_nodes >= self.min_nodes if self.enabled else True
 
     def to_dict(self) -> dict:
-        return {'enabled': self.enabled, 'min_nodes': self.min_nodes, 'max_nodes': self.max_nodes}
+        return self.model_dump()
 
 
 class ClusterPool(BaseModel):
@@ -46,13 +43,7 @@ class ClusterPool(BaseModel):
     autoscaling: NodePoolAutoscalingConfig | None = Field(default=None)
 
     def to_dict(self) -> dict:
-        return {
-            'name': self.name,
-            'node_type': self.node_type,
-            'region': self.region,
-            'number_of_nodes': self.number_of_nodes,
-            'autoscaling': self.autoscaling.to_dict() if self.autoscaling else None,
-        }
+        return self.model_dump()
 
 
 class ClusterCreateSchema(BaseModel):
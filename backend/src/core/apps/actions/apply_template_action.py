@@ -3,6 +3,9 @@ from typing import Any, override
 from src.core.apps.actions.base_post_install_action import BasePrePostInstallAction
 from src.core.kubernetes.kubernetes_cluster import KubernetesCluster
 from src.core.template_loader import template_loader
+from src.core.utils import setup_logger
+
+logger = setup_logger('ApplyTemplateAction')
 
 
 class ApplyTemplateAction(BasePrePostInstallAction):
@@ -26,12 +29,11 @@ class ApplyTemplateAction(BasePrePostInstallAction):
     async def run(self, cluster: KubernetesCluster, namespace: str, config_values: dict[str, Any]) -> None:
         values = {'namespace': namespace, **config_values, **self.values}
 
-        print(f'Applying action with values: {values}')
+        logger.debug('Applying action %s with values: %s', self.name, values)
+
+        rendered_template = template_loader.render_template(self.template_name, self.template_module, values)
 
-        with template_loader.render_to_temp_file(
-            self.template_name, values, self.template_module
-        ) as rendered_template_file:
-            cluster.apply_file(rendered_template_file, with_custom_objects=self.with_custom_objects)
+        cluster.apply_manifest(rendered_template, with_custom_objects=self.with_custom_objects)
 
     def _validate(self) -> None:
         if not self.template_name.endswith('.yaml'):
@@ -1,11 +1,12 @@
+import copy
 import re
 from enum import StrEnum
-from functools import lru_cache
-from typing import Any
+from functools import cached_property
+from itertools import islice
+from typing import Any, Final
 
-import requests
 from packaging.version import Version
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from src.core.apps.actions.base_post_install_action import BasePrePostInstallAction
 from src.core.apps.actions.create_secret_action import CreateSecretAction
 from src.core.apps.base_application import (
@@ -16,7 +17,19 @@ from src.core.apps.base_application import (
     VolumeRequirement,
 )
 from src.core.kubernetes.chart_config import HelmChart
-from src.core.utils import generate_password
+from src.core.utils import async_cache, generate_password, get_github_release_tags
+
+# Release tags of stable Airflow versions, e.g. 3.0.2
+_VERSION_TAG_RE = re.compile(r'^\d{1,2}\.\d\.\d$')
+# Patterns for AirflowConfig fields, matched with fullmatch so a trailing newline is rejected
+_VERSION_RE = re.compile(r'\d\.\d{1,2}\.\d')
+_DAGS_REPO_RE = re.compile(r'https://[A-Za-z0-9._~:/-]{10,}\.git')
+
+
+def _registry_host_url(registry_url: str) -> str:
+    # e.g. https://registry.example.com/team/airflow -> https://registry.example.com
+    scheme, separator, rest = registry_url.rpartition('://')
+    return f'{scheme}{separator}{rest.partition("/")[0]}'
 
 
 class AirflowExecutor(StrEnum):
@@ -27,15 +40,18 @@ class AirflowExecutor(StrEnum):
 
 
 class AirflowConfig(BaseModel):
-    version: str = Field(pattern=r'^\d\.\d{1,2}\.\d$')
+    # AirflowApplication caches values derived from the config, so it must not change after validation
+    model_config = ConfigDict(frozen=True)
+
+    version: str
     use_custom_image: bool = False
     private_registry_url: str | None = None
     private_registry_username: str | None = None
     private_registry_password: str | None = None
     private_registry_image_tag: str | None = None
     node_selector: dict | None = Field(default=None)
-    dags_repository: str = Field(pattern=r'^https:\/\/.{10,}\.git$')
-    dags_repository_ssh_private_key: str = Field(default=None)
+    dags_repository: str
+    dags_repository_ssh_private_key: str | None = Field(default=None)
     dags_repository_branch: str = Field(default='main')
     dags_repository_subpath: str = Field(default='dags')
     executor: AirflowExecutor = AirflowExecutor.CeleryExecutor
@@ -43,6 +59,155 @@ class AirflowConfig(BaseModel):
     pgbouncer_enabled: bool = False
     instance_name: str = Field(max_length=20)
 
+    @field_validator('version')
+    @classmethod
+    def validate_version(cls, value: str) -> str:
+        if not _VERSION_RE.fullmatch(value):
+            raise ValueError(f'Invalid Airflow version: {value}')
+        return value
+
+    @field_validator('dags_repository')
+    @classmethod
+    def validate_dags_repository(cls, value: str) -> str:
+        if not _DAGS_REPO_RE.fullmatch(value):
+            raise ValueError('DAGs repository must be an HTTPS git URL ending with .git')
+        return value
+
+
+# Chart values that do not depend on the application config; keys set per instance in
+# AirflowApplication.chart_values are left as None placeholders to keep the key order. It is only read through
+# copy.deepcopy, so the chart values handed out never alias it
+_AIRFLOW_STATIC_CHART_VALUES: Final[dict[str, Any]] = {
+    'airflowVersion': None,
+    'defaultAirflowTag': None,
+    'executor': None,
+    'flower': {'enabled': None},
+    'images': {
+        'migrationsWaitTimeout': 300,
+        # "useDefaultImageForMigration": True,
+    },
+    'multiNamespaceMode': True,
+    'useStandardNaming': True,
+    'config': {
+        'webserver': {
+            # "expose_config": True,
+            # "navbar_color": '#000',
+            'require_confirmation_dag_change': True,
+            'instance_name': None,
+            'default_ui_timezone': 'Europe/Prague',
+        },
+        'core': {'max_active_runs_per_dag': 1, 'dags_are_paused_at_creation': True, 'load_examples': False},
+        'scheduler': {'enable_health_check': False, 'catchup_by_default': False},
+    },
+    'pgbouncer': {'enabled': None},
+    'dags': {
+        'gitSync': {
+            'enabled': True,
+            'repo': None,
+            'branch': None,
+            'rev': 'HEAD',
+            'depth': 1,
+            'maxFailures': 1,
+            'subPath': None,
+        }
+    },
+    'logs': {
+        'persistence': {
+            'enabled': True,
+            'size': '10Gi',
+            'storageClassName': 'longhorn',
+        }
+    },
+    # "registry": {
+    #     #"secretName": "private-registry-creds"
+    #     "connection": {
+    #         "user": "",
+    #         "pass": "",
+    #         "host": ""
+    #     }
+    # },
+    'nodeSelector': None,
+    'createUserJob': {
+        'env': [
+            {
+                'name': 'ADMIN_PASSWORD',
+                'valueFrom': {'secretKeyRef': {'name': None, 'key': 'password'}},
+            },
+        ],
+        'args': [
+            'bash',
+            '-c',
+            'exec \\\nairflow {{ semverCompare ">=2.0.0" .Values.airflowVersion | ternary "users create" "create_user" }} "$@"',  # noqa: E501 # fmt: skip
+            '--',
+            '-r',
+            '{{ .Values.webserver.defaultUser.role }}',
+            '-u',
+            '{{ .Values.webserver.defaultUser.username }}',
+            '-e',
+            '{{ .Values.webserver.defaultUser.email }}',
+            '-f',
+            '{{ .Values.webserver.defaultUser.firstName }}',
+            '-l',
+            '{{ .Values.webserver.defaultUser.lastName }}',
+            '-p',
+            '$(ADMIN_PASSWORD)',
+        ],
+    },
+}
+
+# Template for get_resource_values, which hands out deep copies so callers can modify them freely
+_AIRFLOW_RESOURCE_VALUES: Final[dict[str, Any]] = {
+    'workers': {
+        'resources': {
+            'requests': {'cpu': '200m', 'memory': '256Mi'},
+            # 'limits': {
+            #     'cpu': '2',
+            #     'memory': '2Gi'
+            # }
+        }
+    },
+    'scheduler': {
+        'resources': {
+            'requests': {'cpu': '500m', 'memory': '512Mi'},
+            # 'limits': {
+            #     'cpu': '1',
+            #     'memory': '1Gi'
+            # }
+        }
+    },
+    'webserver': {
+        'startupProbe': {'timeoutSeconds': 360, 'failureThreshold': 20, 'periodSeconds': 30},
+        'resources': {
+            'requests': {'cpu': '1', 'memory': '2Gi'},
+            # 'limits': {
+            #     'cpu': '2',
+            #     'memory': '4Gi'
+            # }
+        },
+    },
+}
+
+_ACCESSIBLE_ENDPOINTS: Final[tuple[AccessEndpoint, ...]] = (
+    AccessEndpoint(
+        name='web-ui',
+        description='Airflow Web UI',
+        default_access=AccessEndpointType.CLUSTER_IP_PATH,
+        default_value='/airflow',
+        required=True,
+    ),
+    AccessEndpoint(
+        name='flower-ui',
+        description='Airflow Flower UI',
+        default_access=AccessEndpointType.CLUSTER_IP_PATH,
+        default_value='/flower/',  # Keep trailing slash
+        required=False,
+    ),
+)
+
+_VOLUME_REQUIREMENTS: Final[tuple[VolumeRequirement, ...]] = (
+    VolumeRequirement(name='airflow-logs', size=100, description='Persistent storage for Airflow logs'),
+)
+
 
 class AirflowApplication(BaseApplication):
     _helm_chart = HelmChart(
@@ -60,115 +225,57 @@ class AirflowApplication(BaseApplication):
 
     @classmethod
     def get_volume_requirements(cls) -> list[VolumeRequirement]:
-        return [VolumeRequirement(name='airflow-logs', size=100, description='Persistent storage for Airflow logs')]
+        return list(_VOLUME_REQUIREMENTS)
 
     @classmethod
     def get_resource_values(cls) -> dict:
-        return {
-            'workers': {
-                'resources': {
-                    'requests': {'cpu': '200m', 'memory': '256Mi'},
-                    # 'limits': {
-                    #     'cpu': '2',
-                    #     'memory': '2Gi'
-                    # }
-                }
-            },
-            'scheduler': {
-                'resources': {
-                    'requests': {'cpu': '500m', 'memory': '512Mi'},
-                    # 'limits': {
-                    #     'cpu': '1',
-                    #     'memory': '1Gi'
-                    # }
-                }
-            },
-            'webserver': {
-                'startupProbe': {'timeoutSeconds': 360, 'failureThreshold': 20, 'periodSeconds': 30},
-                'resources': {
-                    'requests': {'cpu': '1', 'memory': '2Gi'},
-                    # 'limits': {
-                    #     'cpu': '2',
-                    #     'memory': '4Gi'
-                    # }
-                },
-            },
-        }
+        return copy.deepcopy(_AIRFLOW_RESOURCE_VALUES)
 
     @classmethod
     def get_accessible_endpoints(cls) -> list[AccessEndpoint]:
-        return [
-            AccessEndpoint(
-                name='web-ui',
-                description='Airflow Web UI',
-                default_access=AccessEndpointType.CLUSTER_IP_PATH,
-                default_value='/airflow',
-                required=True,
-            ),
-            AccessEndpoint(
-                name='flower-ui',
-                description='Airflow Flower UI',
-                default_access=AccessEndpointType.CLUSTER_IP_PATH,
-                default_value='/flower/',  # Keep trailing slash
-                required=False,
-            ),
-        ]
+        return list(_ACCESSIBLE_ENDPOINTS)
 
     def get_ingress_helm_values(
         self, access_endpoint_configs: list[AccessEndpointConfig], cluster_base_ip: str, namespace: str
     ) -> dict[str, Any]:
-        defined_endpoints = {ep.name: ep for ep in self.get_accessible_endpoints()}
-        configured_map = {epc.name: epc for epc in access_endpoint_configs}
+        configured_map = self._map_configured_endpoints(access_endpoint_configs)
 
-        # Validate that all required endpoints are configured
-        for ep_name, accessible_ep in defined_endpoints.items():
-            if accessible_ep.required and ep_name not in configured_map:
-                raise ValueError(f"Required endpoint '{ep_name}' is not configured.")
-
-        web_ui_access_endpoint = next(iter([x for x in access_endpoint_configs if x.name == 'web-ui']))
+        web_ui_access_endpoint = configured_map['web-ui']
         web_ui_config = self._generate_endpoint_helm_values(web_ui_access_endpoint, cluster_base_ip, namespace)
 
-        flower_ui_access_endpoint = [x for x in access_endpoint_configs if x.name == 'flower-ui']
+        flower_ui_access_endpoint = configured_map.get('flower-ui')
 
         if flower_ui_access_endpoint and self._config.executor == AirflowExecutor.CeleryExecutor:
-            flower_ui_access_endpoint = flower_ui_access_endpoint[0]
-
             flower_ui_config = self._generate_endpoint_helm_values(
                 flower_ui_access_endpoint, cluster_base_ip, namespace
             )
         else:
             flower_ui_config = None
 
-        use_https = web_ui_access_endpoint.access_type in (AccessEndpointType.SUBDOMAIN, AccessEndpointType.DOMAIN_PATH)
-
-        common_annotations = {
-            'traefik.ingress.kubernetes.io/router.entrypoints': 'websecure' if use_https else 'web',
-            'traefik.ingress.kubernetes.io/router.priority': '10',
-            'cert-manager.io/cluster-issuer': 'acme-prod',
-        }
+        use_https = self._uses_https(web_ui_access_endpoint)
+        common_annotations = self._get_ingress_annotations(use_https)
 
         return {
             'config': {'webserver': {'base_url': web_ui_config['base_url']}},
             'ingress': {
-                'web': {
-                    'enabled': True,
-                    'ingressClassName': 'traefik',
-                    'pathType': 'Prefix',
-                    'annotations': common_annotations,
-                    'path': web_ui_config['path'],
-                    'hosts': web_ui_config['hosts'],
-                },
-                'flower': {
-                    'enabled': bool(flower_ui_access_endpoint),
-                    'ingressClassName': 'traefik',
-                    'pathType': 'Prefix',
-                    'annotations': common_annotations,
-                    'path': flower_ui_config['path'] if flower_ui_access_endpoint and flower_ui_config else None,
-                    'hosts': flower_ui_config['hosts'] if flower_ui_access_endpoint and flower_ui_config else None,
-                },
+                'web': self._ingress_entry(web_ui_config, True, common_annotations),
+                'flower': self._ingress_entry(flower_ui_config, bool(flower_ui_access_endpoint), common_annotations),
             },
         }
 
+    @staticmethod
+    def _ingress_entry(
+        endpoint_values: dict[str, Any] | None, enabled: bool, annotations: dict[str, str]
+    ) -> dict[str, Any]:
+        return {
+            'enabled': enabled,
+            'ingressClassName': 'traefik',
+            'pathType': 'Prefix',
+            'annotations': annotations,
+            'path': endpoint_values['path'] if endpoint_values else None,
+            'hosts': endpoint_values['hosts'] if endpoint_values else None,
+        }
+
     def _generate_endpoint_helm_values(
         self, endpoint_config: AccessEndpointConfig, cluster_base_ip: str, namespace: str
     ) -> dict[str, Any]:
@@ -186,11 +293,12 @@ class AirflowApplication(BaseApplication):
 
             base_url = f'http://{endpoint_config.value}'
         elif endpoint_config.access_type == AccessEndpointType.DOMAIN_PATH:
-            path_value = endpoint_config.value[endpoint_config.value.find('/') :]
+            domain, separator, path = endpoint_config.value.partition('/')
+            path_value = separator + path
 
             hosts = [
                 {
-                    'name': endpoint_config.value[: endpoint_config.value.find('/')],
+                    'name': domain,
                     'tls': {'enabled': True, 'secretName': f'{namespace}-{endpoint_config.name}-tls'},
                 }
             ]
@@ -208,111 +316,47 @@ class AirflowApplication(BaseApplication):
         return {'path': path_value, 'hosts': hosts, 'base_url': base_url}
 
     @classmethod
-    @lru_cache
-    def get_available_versions(cls) -> list[str]:
+    async def get_available_versions(cls) -> list[str]:
         try:
-            r = requests.get('https://api.github.com/repos/apache/airflow/releases', timeout=15).json()
+            return list(await cls._fetch_available_versions())
         except Exception:
             cls._logger.exception('Failed to retrieve available versions for Airflow')
             return ['2.11.0']
 
-        versions = [x['tag_name'].replace('v', '') for x in r if re.search(r'^\d{1,2}\.\d\.\d$', x['tag_name'])][:30]
+    @classmethod
+    @async_cache(ttl_seconds=3600)
+    async def _fetch_available_versions(cls) -> tuple[str, ...]:
+        # Errors propagate uncached, so a failed lookup is retried on the next call
+        # Results expire hourly so new releases show up without a restart
+        tags = await get_github_release_tags('apache/airflow')
+
+        versions = list(islice((tag.replace('v', '') for tag in tags if _VERSION_TAG_RE.match(tag)), 30))
 
-        return sorted(versions, key=Version, reverse=True)
+        return tuple(sorted(versions, key=Version, reverse=True))
 
-    @property
+    @cached_property
     def chart_values(self) -> dict[str, Any]:
-        # dags_repository_ssh_key_base64 = (
-        #     base64.b64encode(self._config.dags_repository_ssh_private_key.encode()).decode()
-        # )
-
-        values = {
-            'airflowVersion': self._config.version if not self._config.use_custom_image else '2.11.0',
-            'defaultAirflowTag': self._config.version
-            if not self._config.use_custom_image
-            else self._config.private_registry_image_tag,
-            'executor': self._config.executor,
-            'flower': {'enabled': self._config.flower_enabled},
-            'images': {
-                'migrationsWaitTimeout': 300,
-                # "useDefaultImageForMigration": True,
-            },
-            'multiNamespaceMode': True,
-            'useStandardNaming': True,
-            'config': {
-                'webserver': {
-                    # "expose_config": True,
-                    # "navbar_color": '#000',
-                    'require_confirmation_dag_change': True,
-                    'instance_name': self._config.instance_name,
-                    'default_ui_timezone': 'Europe/Prague',
-                },
-                'core': {'max_active_runs_per_dag': 1, 'dags_are_paused_at_creation': True, 'load_examples': False},
-                'scheduler': {'enable_health_check': False, 'catchup_by_default': False},
-            },
-            'pgbouncer': {'enabled': self._config.pgbouncer_enabled},
-            'dags': {
-                'gitSync': {
-                    'enabled': True,
-                    'repo': self._config.dags_repository,
-                    'branch': self._config.dags_repository_branch,
-                    'rev': 'HEAD',
-                    'depth': 1,
-                    'maxFailures': 1,
-                    'subPath': self._config.dags_repository_subpath,
-                    # "sshKeySecret": "airflow-ssh-secret" if self._config.dags_repository_ssh_private_key is not None
-                    # else None
-                }
-            },
-            'logs': {
-                'persistence': {
-                    'enabled': True,
-                    'size': '10Gi',
-                    'storageClassName': 'longhorn',
-                }
-            },
-            # "registry": {
-            #     #"secretName": "private-registry-creds"
-            #     "connection": {
-            #         "user": "",
-            #         "pass": "",
-            #         "host": ""
-            #     }
-            # },
-            'nodeSelector': self._config.node_selector,
-            # "extraSecrets": f"""
-            # 'airflow-ssh-secret':
-            #     type: 'Opaque'
-            #     data: |
-            #       gitSshKey: '{dags_repository_ssh_key_base64}'
-            # """
-            'createUserJob': {
-                'env': [
-                    {
-                        'name': 'ADMIN_PASSWORD',
-                        'valueFrom': {'secretKeyRef': {'name': self.credentials_secret_name, 'key': 'password'}},
-                    },
-                ],
-                'args': [
-                    'bash',
-                    '-c',
-                    'exec \\\nairflow {{ semverCompare ">=2.0.0" .Values.airflowVersion | ternary "users create" "create_user" }} "$@"',  # noqa: E501 # fmt: skip
-                    '--',
-                    '-r',
-                    '{{ .Values.webserver.defaultUser.role }}',
-                    '-u',
-                    '{{ .Values.webserver.defaultUser.username }}',
-                    '-e',
-                    '{{ .Values.webserver.defaultUser.email }}',
-                    '-f',
-                    '{{ .Values.webserver.defaultUser.firstName }}',
-                    '-l',
-                    '{{ .Values.webserver.defaultUser.lastName }}',
-                    '-p',
-                    '$(ADMIN_PASSWORD)',
-                ],
-            },
-        }
+        # Copied once per instance (chart_values is cached), so no branch of the returned dict aliases the template
+        values = copy.deepcopy(_AIRFLOW_STATIC_CHART_VALUES)
+
+        values['airflowVersion'] = self._config.version if not self._config.use_custom_image else '2.11.0'
+        values['defaultAirflowTag'] = (
+            self._config.version if not self._config.use_custom_image else self._config.private_registry_image_tag
+        )
+        values['executor'] = self._config.executor
+        values['flower']['enabled'] = self._config.flower_enabled
+        values['config']['webserver']['instance_name'] = self._config.instance_name
+        values['pgbouncer']['enabled'] = self._config.pgbouncer_enabled
+        values['dags']['gitSync'].update(
+            {
+                'repo': self._config.dags_repository,
+                'branch': self._config.dags_repository_branch,
+                'subPath': self._config.dags_repository_subpath,
+                # 'sshKeySecret': 'airflow-ssh-secret' if self._config.dags_repository_ssh_private_key else None
+            }
+        )
+        values['nodeSelector'] = self._config.node_selector
+        values['createUserJob']['env'][0]['valueFrom']['secretKeyRef']['name'] = self.credentials_secret_name
 
         # if self._config.use_custom_image:
         #     values['images']['airflow'] = {
@@ -321,10 +365,24 @@ class AirflowApplication(BaseApplication):
         #     }
 
         # TODO: replace with proper dict merge
-        return {**values, **self.get_resource_values()}
+        values.update(self.get_resource_values())
+
+        return values
 
     @property
     def pre_installation_actions(self) -> list[BasePrePostInstallAction]:
+        registry_url = self._config.private_registry_url
+        # The action is skipped without a custom image, so its data is only assembled when it will be used
+        registry_secret_data = (
+            {
+                'url': _registry_host_url(registry_url) if registry_url else None,
+                'username': self._config.private_registry_username,
+                'password': self._config.private_registry_password,
+            }
+            if self._config.use_custom_image
+            else {}
+        )
+
         return [
             CreateSecretAction(
                 name='CreateAirflowCredentialsSecret',
@@ -335,13 +393,7 @@ class AirflowApplication(BaseApplication):
             CreateSecretAction(
                 name='CreatePrivateRegistryCredentialsSecret',
                 secret_name='private-registry-creds',  # noqa: S106 (not a secret)
-                secret_data={
-                    'url': self._config.private_registry_url[: self._config.private_registry_url.index('/', 8)]
-                    if self._config.private_registry_url
-                    else None,
-                    'username': self._config.private_registry_username,
-                    'password': self._config.private_registry_password,
-                },
+                secret_data=registry_secret_data,
                 secret_type='docker-registry',  # noqa: S106 (not a secret)
                 condition=self._config.use_custom_image,
             ),
@@ -48,11 +48,11 @@ class ApplicationFactory:
         _, _, metadata = cls._get_app_info(app_id)
         return metadata
 
-    @staticmethod
-    def get_application(application_id: int, application_config: dict) -> BaseApplication:
-        app_class, config_class, _ = ApplicationFactory._get_app_info(application_id)
+    @classmethod
+    def get_application(cls, application_id: int, application_config: dict) -> BaseApplication:
+        app_class, config_class, _ = cls._get_app_info(application_id)
 
-        config_instance = config_class(**application_config)
+        config_instance = config_class.model_validate(application_config)
 
         return app_class(config_instance)
 
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import re
+import string
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from src.core.utils import setup_logger
 
@@ -15,8 +15,21 @@ if TYPE_CHECKING:
     from src.core.kubernetes.chart_config import HelmChart
     from src.core.kubernetes.kubernetes_cluster import KubernetesCluster
 
+# Deletes every character allowed in a subdomain, so a valid value translates to an empty string
+_SUBDOMAIN_CHARS_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + '.-')
 
-@dataclass
+# Traefik ingress annotations shared by all applications, keyed by whether HTTPS is used; callers must not mutate them
+_INGRESS_ANNOTATIONS: Final[dict[bool, dict[str, str]]] = {
+    use_https: {
+        'traefik.ingress.kubernetes.io/router.entrypoints': 'websecure' if use_https else 'web',
+        'traefik.ingress.kubernetes.io/router.priority': '10',
+        'cert-manager.io/cluster-issuer': 'acme-prod',
+    }
+    for use_https in (True, False)
+}
+
+
+@dataclass(frozen=True, slots=True)
 class VolumeRequirement:
     name: str
     size: int  # in GB
@@ -29,7 +42,13 @@ class AccessEndpointType(StrEnum):
     CLUSTER_IP_PATH = 'cluster_ip_path'
 
 
-@dataclass(frozen=True)
+# Access types served on a domain, which get a TLS certificate and the HTTPS entrypoint
+_TLS_ACCESS_TYPES: Final[frozenset[AccessEndpointType]] = frozenset(
+    {AccessEndpointType.SUBDOMAIN, AccessEndpointType.DOMAIN_PATH}
+)
+
+
+@dataclass(frozen=True, slots=True)
 class AccessEndpoint:
     # e.g., "web-ui", "flower-ui"
     name: str
@@ -43,7 +62,7 @@ class AccessEndpoint:
     required: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccessEndpointConfig:
     name: str
     access_type: AccessEndpointType
@@ -76,7 +95,7 @@ class BaseApplication(ABC):
 
     @classmethod
     @abstractmethod
-    def get_available_versions(cls) -> list[str]: ...
+    async def get_available_versions(cls) -> list[str]: ...
 
     @classmethod
     @abstractmethod
@@ -96,10 +115,34 @@ class BaseApplication(ABC):
         self, access_endpoint_configs: list[AccessEndpointConfig], cluster_base_ip: str, namespace: str
     ) -> dict[str, Any]: ...
 
+    @classmethod
+    def _map_configured_endpoints(
+        cls, access_endpoint_configs: list[AccessEndpointConfig]
+    ) -> dict[str, AccessEndpointConfig]:
+        configured_map = {epc.name: epc for epc in access_endpoint_configs}
+
+        # Validate that all required endpoints are configured
+        if missing_endpoints := [
+            ep.name for ep in cls.get_accessible_endpoints() if ep.required and ep.name not in configured_map
+        ]:
+            raise ValueError(f"Required endpoint '{', '.join(missing_endpoints)}' is not configured.")
+
+        return configured_map
+
+    @staticmethod
+    def _uses_https(endpoint_config: AccessEndpointConfig) -> bool:
+        return endpoint_config.access_type in _TLS_ACCESS_TYPES
+
+    @staticmethod
+    def _get_ingress_annotations(use_https: bool) -> dict[str, str]:
+        return _INGRESS_ANNOTATIONS[use_https]
+
     @staticmethod
     def _validate_access_config(endpoint_config: AccessEndpointConfig) -> None:
         if endpoint_config.access_type == AccessEndpointType.SUBDOMAIN:
-            if not re.match(r'^[a-zA-Z0-9.-]+$', endpoint_config.value) or '--' in endpoint_config.value:
+            value = endpoint_config.value
+            # Empty values are rejected, as the former [a-zA-Z0-9.-]+ pattern required at least one character
+            if not value or value.translate(_SUBDOMAIN_CHARS_TABLE) or '--' in value:
                 raise ValueError(f'Invalid subdomain format for {endpoint_config.name}: {endpoint_config.value}')
         elif endpoint_config.access_type == AccessEndpointType.DOMAIN_PATH:
             if '/' not in endpoint_config.value:
@@ -1,12 +1,17 @@
+import copy
 import re
-from functools import lru_cache
-from typing import Any
+from functools import cached_property
+from itertools import islice
+from typing import Any, Final
 
-import requests
 from packaging.version import Version
 from pydantic import BaseModel
 from src.core.apps.base_application import AccessEndpoint, AccessEndpointConfig, AccessEndpointType, BaseApplication
 from src.core.kubernetes.chart_config import HelmChart
+from src.core.utils import async_cache, get_github_release_tags
+
+# Release tags of stable Grafana versions, e.g. v11.6.1
+_VERSION_TAG_RE = re.compile(r'^v\d{1,2}\.\d\.\d$')
 
 
 class GrafanaConfig(BaseModel):
@@ -14,6 +19,33 @@ class GrafanaConfig(BaseModel):
     number_of_replicas: int = 1
 
 
+# Chart values that do not depend on the application config; per-instance keys are None placeholders
+_GRAFANA_STATIC_CHART_VALUES: Final[dict[str, Any]] = {
+    'image': None,
+    'persistence': {
+        'enabled': True,
+        'type': 'pvc',
+        'accessModes': ['ReadWriteOnce'],
+        'size': '10Gi',
+        'storageClassName': 'hcloud-volumes',
+    },
+    'replicas': None,
+    'rbac': {
+        'namespaced': True  # allows deploying multiple instances on one cluster
+    },
+}
+
+_ACCESSIBLE_ENDPOINTS: Final[tuple[AccessEndpoint, ...]] = (
+    AccessEndpoint(
+        name='web-ui',
+        description='Grafana Web UI',
+        default_access=AccessEndpointType.CLUSTER_IP_PATH,
+        default_value='/grafana',
+        required=True,
+    ),
+)
+
+
 class GrafanaApplication(BaseApplication):
     _helm_chart = HelmChart(
         name='grafana',
@@ -29,17 +61,23 @@ class GrafanaApplication(BaseApplication):
         super().__init__('Grafana')
 
     @classmethod
-    @lru_cache
-    def get_available_versions(cls) -> list[str]:
+    async def get_available_versions(cls) -> list[str]:
         try:
-            r = requests.get('https://api.github.com/repos/grafana/grafana/releases?per_page=100', timeout=15).json()
+            return list(await cls._fetch_available_versions())
         except Exception:
             cls._logger.exception('Failed to retrieve available versions for Grafana')
             return ['11.6']
 
-        versions = [x['tag_name'].replace('v', '') for x in r if re.search(r'^v\d{1,2}\.\d\.\d$', x['tag_name'])][:30]
+    @classmethod
+    @async_cache(ttl_seconds=3600)
+    async def _fetch_available_versions(cls) -> tuple[str, ...]:
+        # Errors propagate uncached, so a failed lookup is retried on the next call
+        # Results expire hourly so new releases show up without a restart
+        tags = await get_github_release_tags('grafana/grafana', params={'per_page': 100})
+
+        versions = list(islice((tag.replace('v', '') for tag in tags if _VERSION_TAG_RE.match(tag)), 30))
 
-        return sorted(versions, key=Version, reverse=True)
+        return tuple(sorted(versions, key=Version, reverse=True))
 
     @classmethod
     def get_volume_requirements(cls) -> list:
@@ -47,15 +85,7 @@ class GrafanaApplication(BaseApplication):
 
     @classmethod
     def get_accessible_endpoints(cls) -> list[AccessEndpoint]:
-        return [
-            AccessEndpoint(
-                name='web-ui',
-                description='Grafana Web UI',
-                default_access=AccessEndpointType.CLUSTER_IP_PATH,
-                default_value='/grafana',
-                required=True,
-            )
-        ]
+        return list(_ACCESSIBLE_ENDPOINTS)
 
     @classmethod
     def get_resource_values(cls) -> dict:
@@ -64,25 +94,15 @@ class GrafanaApplication(BaseApplication):
     def get_ingress_helm_values(
         self, access_endpoint_configs: list[AccessEndpointConfig], cluster_base_ip: str, namespace: str
     ) -> dict[str, Any]:
-        defined_endpoints = {ep.name: ep for ep in self.get_accessible_endpoints()}
-        configured_map = {epc.name: epc for epc in access_endpoint_configs}
-
-        # Validate that all required endpoints are configured
-        for ep_name, accessible_ep in defined_endpoints.items():
-            if accessible_ep.required and ep_name not in configured_map:
-                raise ValueError(f"Required endpoint '{ep_name}' is not configured.")
+        configured_map = self._map_configured_endpoints(access_endpoint_configs)
 
-        web_ui_access_endpoint = next(iter([x for x in access_endpoint_configs if x.name == 'web-ui']))
+        web_ui_access_endpoint = configured_map['web-ui']
 
         web_ui_config = self._generate_endpoint_helm_values(web_ui_access_endpoint, cluster_base_ip, namespace)
 
-        use_https = web_ui_access_endpoint.access_type in (AccessEndpointType.SUBDOMAIN, AccessEndpointType.DOMAIN_PATH)
+        use_https = self._uses_https(web_ui_access_endpoint)
 
-        common_annotations = {
-            'traefik.ingress.kubernetes.io/router.entrypoints': 'websecure' if use_https else 'web',
-            'traefik.ingress.kubernetes.io/router.priority': '10',
-            'cert-manager.io/cluster-issuer': 'acme-prod',
-        }
+        common_annotations = self._get_ingress_annotations(use_https)
 
         helm_ingress_hosts = []
         helm_ingress_tls = []
@@ -124,10 +144,11 @@ class GrafanaApplication(BaseApplication):
             ]
             base_url = f'https://{endpoint_config.value}'
         elif endpoint_config.access_type == AccessEndpointType.DOMAIN_PATH:
-            path_value = endpoint_config.value[endpoint_config.value.find('/') :]
+            domain, separator, path = endpoint_config.value.partition('/')
+            path_value = separator + path
             hosts = [
                 {
-                    'name': endpoint_config.value[: endpoint_config.value.find('/')],
+                    'name': domain,
                     'tls': {'enabled': True, 'secretName': f'{namespace}-{endpoint_config.name}-tls'},
                 }
             ]
@@ -141,21 +162,12 @@ class GrafanaApplication(BaseApplication):
 
         return {'path': path_value, 'hosts': hosts, 'base_url': base_url}
 
-    @property
+    @cached_property
     def chart_values(self) -> dict[str, Any]:
-        values = {
-            'image': {'tag': self._config.version},
-            'persistence': {
-                'enabled': True,
-                'type': 'pvc',
-                'accessModes': ['ReadWriteOnce'],
-                'size': '10Gi',
-                'storageClassName': 'hcloud-volumes',
-            },
-            'replicas': self._config.number_of_replicas,
-            'rbac': {
-                'namespaced': True  # allows deploying multiple instances on one cluster
-            },
-        }
+        # Copied once per instance (chart_values is cached), so no branch of the returned dict aliases the template
+        values = copy.deepcopy(_GRAFANA_STATIC_CHART_VALUES)
+
+        values['image'] = {'tag': self._config.version}
+        values['replicas'] = self._config.number_of_replicas
 
         return values
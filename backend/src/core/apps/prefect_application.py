@@ -1,5 +1,5 @@
-from functools import lru_cache
-from typing import Any
+from functools import cached_property
+from typing import Any, Final
 
 from pydantic import BaseModel
 from src.core.apps.actions.base_post_install_action import BasePrePostInstallAction
@@ -13,6 +13,17 @@ class PrefectConfig(BaseModel):
     version: str = '3.4.8'
 
 
+_ACCESSIBLE_ENDPOINTS: Final[tuple[AccessEndpoint, ...]] = (
+    AccessEndpoint(
+        name='web-ui',
+        description='Prefect Web UI',
+        default_access=AccessEndpointType.CLUSTER_IP_PATH,
+        default_value='/prefect',
+        required=True,
+    ),
+)
+
+
 class PrefectApplication(BaseApplication):
     _helm_chart = HelmChart(
         name='prefect-server',
@@ -30,8 +41,7 @@ class PrefectApplication(BaseApplication):
         super().__init__('Prefect')
 
     @classmethod
-    @lru_cache
-    def get_available_versions(cls) -> list[str]:
+    async def get_available_versions(cls) -> list[str]:
         # TODO: replace with actual version list + move to base class
         return ['2.10.3']
 
@@ -41,15 +51,7 @@ class PrefectApplication(BaseApplication):
 
     @classmethod
     def get_accessible_endpoints(cls) -> list[AccessEndpoint]:
-        return [
-            AccessEndpoint(
-                name='web-ui',
-                description='Prefect Web UI',
-                default_access=AccessEndpointType.CLUSTER_IP_PATH,
-                default_value='/prefect',
-                required=True,
-            )
-        ]
+        return list(_ACCESSIBLE_ENDPOINTS)
 
     @classmethod
     def get_resource_values(cls) -> dict:
@@ -58,26 +60,16 @@ class PrefectApplication(BaseApplication):
     def get_ingress_helm_values(
         self, access_endpoint_configs: list[AccessEndpointConfig], cluster_base_ip: str, namespace: str
     ) -> dict[str, Any]:
-        defined_endpoints = {ep.name: ep for ep in self.get_accessible_endpoints()}
-        configured_map = {epc.name: epc for epc in access_endpoint_configs}
+        configured_map = self._map_configured_endpoints(access_endpoint_configs)
 
-        # Validate that all required endpoints are configured
-        for ep_name, accessible_ep in defined_endpoints.items():
-            if accessible_ep.required and ep_name not in configured_map:
-                raise ValueError(f"Required endpoint '{ep_name}' is not configured.")
-
-        web_ui_access_endpoint = next(iter([x for x in access_endpoint_configs if x.name == 'web-ui']))
+        web_ui_access_endpoint = configured_map['web-ui']
 
         web_ui_config = self._generate_endpoint_helm_values(web_ui_access_endpoint, cluster_base_ip, namespace)
 
-        use_https = web_ui_access_endpoint.access_type in (AccessEndpointType.SUBDOMAIN, AccessEndpointType.DOMAIN_PATH)
+        use_https = self._uses_https(web_ui_access_endpoint)
 
-        common_annotations = {
-            'traefik.ingress.kubernetes.io/router.entrypoints': 'websecure' if use_https else 'web',
-            'traefik.ingress.kubernetes.io/router.priority': '10',
-            'cert-manager.io/cluster-issuer': 'acme-prod',
-            #'traefik.ingress.kubernetes.io/router.middlewares': 'prefect-server-3-strip-prefix-prefect@kubernetescrd'
-        }
+        # 'traefik.ingress.kubernetes.io/router.middlewares': 'prefect-server-3-strip-prefix-prefect@kubernetescrd'
+        common_annotations = self._get_ingress_annotations(use_https)
 
         self._base_url = f'{web_ui_config["base_url"]}/api'
 
@@ -146,10 +138,11 @@ class PrefectApplication(BaseApplication):
             ]
             base_url = f'https://{endpoint_config.value}'
         elif endpoint_config.access_type == AccessEndpointType.DOMAIN_PATH:
-            path_value = endpoint_config.value[endpoint_config.value.find('/') :]
+            domain, separator, path = endpoint_config.value.partition('/')
+            path_value = separator + path
             hosts = [
                 {
-                    'name': endpoint_config.value[: endpoint_config.value.find('/')],
+                    'name': domain,
                     'tls': {'enabled': True, 'secretName': f'{endpoint_config.value}-tls'},
                 }
             ]
@@ -163,7 +156,7 @@ class PrefectApplication(BaseApplication):
 
         return {'path': path_value, 'hosts': hosts, 'base_url': base_url}
 
-    @property
+    @cached_property
     def chart_values(self) -> dict[str, Any]:
         values = {'server': {'basicAuth': {'enabled': True, 'existingSecret': self.credentials_secret_name}}}
 
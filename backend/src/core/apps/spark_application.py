@@ -1,5 +1,5 @@
-from functools import lru_cache
-from typing import Any
+from functools import cached_property
+from typing import Any, Final
 
 from pydantic import BaseModel, Field
 
@@ -16,6 +16,17 @@ class SparkConfig(BaseModel):
     max_workers: int = Field(default=3, ge=2, description='Maximum number of worker nodes')
 
 
+_ACCESSIBLE_ENDPOINTS: Final[tuple[AccessEndpoint, ...]] = (
+    AccessEndpoint(
+        name='web-ui',
+        description='Spark Web UI',
+        default_access=AccessEndpointType.CLUSTER_IP_PATH,
+        default_value='/spark',
+        required=True,
+    ),
+)
+
+
 class SparkApplication(BaseApplication):
     _helm_chart = HelmChart(
         name='spark-kubernetes-operator',
@@ -31,22 +42,13 @@ class SparkApplication(BaseApplication):
         super().__init__('Spark')
 
     @classmethod
-    @lru_cache
-    def get_available_versions(cls) -> list[str]:
+    async def get_available_versions(cls) -> list[str]:
         # TODO: replace with actual version list + move to base class
         return ['3.5.1']
 
     @classmethod
     def get_accessible_endpoints(cls) -> list[AccessEndpoint]:
-        return [
-            AccessEndpoint(
-                name='web-ui',
-                description='Spark Web UI',
-                default_access=AccessEndpointType.CLUSTER_IP_PATH,
-                default_value='/spark',
-                required=True,
-            )
-        ]
+        return list(_ACCESSIBLE_ENDPOINTS)
 
     def _generate_endpoint_helm_values(
         self, endpoint_config: AccessEndpointConfig, cluster_base_ip: str, namespace: str
@@ -56,7 +58,9 @@ class SparkApplication(BaseApplication):
     def get_ingress_helm_values(
         self, access_endpoint_configs: list[AccessEndpointConfig], cluster_base_ip: str, namespace: str
     ) -> dict[str, Any]:
-        web_ui_access_endpoint = next(iter([x for x in access_endpoint_configs if x.name == 'web-ui']))
+        configured_map = self._map_configured_endpoints(access_endpoint_configs)
+
+        web_ui_access_endpoint = configured_map['web-ui']
 
         return {'web_ui_path': web_ui_access_endpoint.value}
 
@@ -68,7 +72,7 @@ class SparkApplication(BaseApplication):
     def get_volume_requirements(cls) -> list:
         return []
 
-    @property
+    @cached_property
     def chart_values(self) -> dict[str, Any]:
         return {}
 
@@ -1,5 +1,5 @@
-from functools import lru_cache
-from typing import Any
+from functools import cached_property
+from typing import Any, Final
 
 from pydantic import BaseModel
 from src.core.apps.base_application import AccessEndpoint, AccessEndpointConfig, AccessEndpointType, BaseApplication
@@ -10,6 +10,17 @@ class SupersetConfig(BaseModel):
     version: str = '4.1.3'
 
 
+_ACCESSIBLE_ENDPOINTS: Final[tuple[AccessEndpoint, ...]] = (
+    AccessEndpoint(
+        name='web-ui',
+        description='Superset Web UI',
+        default_access=AccessEndpointType.CLUSTER_IP_PATH,
+        default_value='/superset',
+        required=True,
+    ),
+)
+
+
 class SupersetApplication(BaseApplication):
     _helm_chart = HelmChart(
         name='superset',
@@ -25,8 +36,7 @@ class SupersetApplication(BaseApplication):
         super().__init__('Superset')
 
     @classmethod
-    @lru_cache
-    def get_available_versions(cls) -> list[str]:
+    async def get_available_versions(cls) -> list[str]:
         # TODO: replace with actual version list + move to base class
         return ['2.10.3']
 
@@ -36,15 +46,7 @@ class SupersetApplication(BaseApplication):
 
     @classmethod
     def get_accessible_endpoints(cls) -> list[AccessEndpoint]:
-        return [
-            AccessEndpoint(
-                name='web-ui',
-                description='Superset Web UI',
-                default_access=AccessEndpointType.CLUSTER_IP_PATH,
-                default_value='/superset',
-                required=True,
-            )
-        ]
+        return list(_ACCESSIBLE_ENDPOINTS)
 
     @classmethod
     def get_resource_values(cls) -> dict:
@@ -53,25 +55,15 @@ class SupersetApplication(BaseApplication):
     def get_ingress_helm_values(
         self, access_endpoint_configs: list[AccessEndpointConfig], cluster_base_ip: str, namespace: str
     ) -> dict[str, Any]:
-        defined_endpoints = {ep.name: ep for ep in self.get_accessible_endpoints()}
-        configured_map = {epc.name: epc for epc in access_endpoint_configs}
+        configured_map = self._map_configured_endpoints(access_endpoint_configs)
 
-        # Validate that all required endpoints are configured
-        for ep_name, accessible_ep in defined_endpoints.items():
-            if accessible_ep.required and ep_name not in configured_map:
-                raise ValueError(f"Required endpoint '{ep_name}' is not configured.")
-
-        web_ui_access_endpoint = next(iter([x for x in access_endpoint_configs if x.name == 'web-ui']))
+        web_ui_access_endpoint = configured_map['web-ui']
 
         web_ui_config = self._generate_endpoint_helm_values(web_ui_access_endpoint, cluster_base_ip, namespace)
 
-        use_https = web_ui_access_endpoint.access_type in (AccessEndpointType.SUBDOMAIN, AccessEndpointType.DOMAIN_PATH)
+        use_https = self._uses_https(web_ui_access_endpoint)
 
-        common_annotations = {
-            'traefik.ingress.kubernetes.io/router.entrypoints': 'websecure' if use_https else 'web',
-            'traefik.ingress.kubernetes.io/router.priority': '10',
-            'cert-manager.io/cluster-issuer': 'acme-prod',
-        }
+        common_annotations = self._get_ingress_annotations(use_https)
 
         helm_ingress_hosts = []
         helm_ingress_tls = []
@@ -125,10 +117,11 @@ class SupersetApplication(BaseApplication):
             ]
             base_url = f'https://{endpoint_config.value}'
         elif endpoint_config.access_type == AccessEndpointType.DOMAIN_PATH:
-            path_value = endpoint_config.value[endpoint_config.value.find('/') :]
+            domain, separator, path = endpoint_config.value.partition('/')
+            path_value = separator + path
             hosts = [
                 {
-                    'name': endpoint_config.value[: endpoint_config.value.find('/')],
+                    'name': domain,
                     'tls': {'enabled': True, 'secretName': f'{namespace}-{endpoint_config.name}-tls'},
                 }
             ]
@@ -142,7 +135,7 @@ class SupersetApplication(BaseApplication):
 
         return {'path': path_value, 'hosts': hosts, 'base_url': base_url}
 
-    @property
+    @cached_property
     def chart_values(self) -> dict[str, Any]:
         values = {
             'image': {
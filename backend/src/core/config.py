@@ -1,9 +1,15 @@
+import functools
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 load_dotenv(Path(Path(__file__).parent.parent.parent.absolute(), '.env'))
 
-PATH_TO_K3S_YAML_CONFIGS = Path(Path(__file__).absolute().parent.parent.parent, 'output')
 
-PATH_TO_K3S_YAML_CONFIGS.mkdir(exist_ok=True)
+@functools.cache
+def get_k3s_config_path() -> Path:
+    # Created on first use rather than on import, so importing the providers does not touch the filesystem
+    path = Path(Path(__file__).absolute().parent.parent.parent, 'output')
+    path.mkdir(exist_ok=True)
+
+    return path
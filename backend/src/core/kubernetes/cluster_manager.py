@@ -1,11 +1,15 @@
 import asyncio
-import logging
+import functools
 import re
+import threading
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
+from pydantic import TypeAdapter
 from pydantic_core._pydantic_core import ValidationError
-from src.api.schemas import DeploymentCreateSchema, VolumeCreateSchema
+from src.api.schemas import ClusterPool, DeploymentCreateSchema, VolumeCreateSchema
 from src.core.apps.application_factory import ApplicationFactory
 from src.core.apps.base_application import AccessEndpointType
 from src.core.deployment_status import DeploymentStatus
@@ -18,28 +22,47 @@ from src.core.utils import setup_logger
 from src.database.handlers.sqlite_handler import SQLiteHandler
 from src.database.models import Application, Cluster, Deployment, Volume
 
+# Helm prefixes its errors with this warning about the kubeconfig permissions, which is noise in error messages
+_K8S_WARN_RE = re.compile(
+    r'WARNING: Kubernetes configuration file is (?:world|group)-readable\. This is insecure\. Location: .*\.yaml'
+)
 
-class ClusterManager:
-    _instance: 'ClusterManager' = None
-    _logger: logging.Logger = None
+_MAX_CONCURRENT_PROVISIONING = 4
+
+# Serializes the whole pool list in a single pydantic-core call instead of one model_dump per pool
+_CLUSTER_POOLS_ADAPTER = TypeAdapter(list[ClusterPool])
+
+# backend/data, next to the src package
+_DB_FOLDER = Path(__file__).resolve().parents[3] / 'data'
+
+
+@functools.lru_cache(maxsize=64)
+def _read_kubeconfig(kubeconfig_path: Path, kubeconfig_mtime_ns: int) -> str:
+    # The mtime is part of the key, so a rewritten kubeconfig is read again
+    return kubeconfig_path.read_text()
 
-    def __new__(cls, *args, **kwargs) -> 'ClusterManager':
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
 
-            cls._logger = setup_logger('ClusterManager')
+class ClusterManager:
+    def __init__(self) -> None:
+        self._logger = setup_logger('ClusterManager')
+
+        _DB_FOLDER.mkdir(exist_ok=True)
 
-            db_folder = Path(Path(__file__).parent.parent.parent.parent.absolute(), 'data')
+        self.storage = SQLiteHandler(f'sqlite:///{_DB_FOLDER / "app.db"!s}')
 
-            db_folder.mkdir(exist_ok=True)
+        # cluster_id -> access type -> endpoint values already taken by deployments of that cluster
+        self._endpoint_cache: dict[int, Mapping[AccessEndpointType, frozenset[str]]] = {}
+        # cluster_id -> number of invalidations, so a load that overlapped one does not store its stale result
+        self._endpoint_cache_generations: dict[int, int] = {}
+        self._endpoint_cache_lock = threading.Lock()
 
-            cls.storage = SQLiteHandler(f'sqlite:///{Path(db_folder, "app.db")!s}')
+        # Limits how many clusters and deployments are provisioned at the same time
+        self._provisioning_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PROVISIONING)
 
-            cls._logger.info('ClusterManager initialised')
-        return cls._instance
+        self._logger.info('ClusterManager initialised')
 
     async def create_cluster(self, provider: BaseProvider, cluster_config: ClusterConfiguration) -> None:
-        self._logger.info(f'Will create cluster {cluster_config}')
+        self._logger.info('Will create cluster %s', cluster_config)
 
         cluster_db = Cluster(
             name=cluster_config.name,
@@ -47,76 +70,94 @@ class ClusterManager:
             domain_name=cluster_config.domain_name,
             provider=provider.name,
             provider_config=provider._config.to_dict(),
-            pools=[x.to_dict() for x in cluster_config.pools],
+            pools=_CLUSTER_POOLS_ADAPTER.dump_python(cluster_config.pools),
             status=DeploymentStatus.CREATING,
-            additional_components=cluster_config.additional_components.dict(),
+            additional_components=cluster_config.additional_components.to_dict(),
         )
 
-        cluster_id = self.storage.create_cluster(cluster_db)
-
-        try:
-            cluster = await provider.create_cluster(cluster_config)
-
-            await cluster.install_longhorn()
-
-            # explicit wait to avoid 404 error when exposing Traefik dashboard
-            await asyncio.sleep(10)
+        cluster_id = await asyncio.to_thread(self.storage.create_cluster, cluster_db)
+
+        # Cluster row is created first so it shows up as creating while waiting for a slot
+        async with self._provisioning_semaphore:
+            try:
+                cluster = await provider.create_cluster(cluster_config)
+
+                # Longhorn and cert-manager are independent Helm releases, so they are installed concurrently; the task
+                # group cancels the other install as soon as one fails
+                try:
+                    async with asyncio.TaskGroup() as chart_installs:
+                        chart_installs.create_task(cluster.install_longhorn())
+                        if (
+                            cluster_config.domain_name
+                            and cluster_config.additional_components.traefik_dashboard.enabled
+                        ):
+                            chart_installs.create_task(cluster.install_certmanager(cluster_config.domain_name))
+                except ExceptionGroup as e:
+                    # Unwrapped, so the handlers below store the failed install's own error message
+                    raise e.exceptions[0] from e
+
+                # wait for the Traefik CRDs to avoid 404 error when exposing Traefik dashboard
+                if (
+                    cluster_config.additional_components.traefik_dashboard.enabled
+                    and not await cluster.wait_for_traefik_crds()
+                ):
+                    self._logger.warning('Traefik CRDs are still not available, exposing the dashboard may fail')
+
+                if cluster_config.domain_name and cluster_config.additional_components.traefik_dashboard.enabled:
+                    cluster.expose_traefik_dashboard(
+                        username=cluster_config.additional_components.traefik_dashboard.username,
+                        password=cluster_config.additional_components.traefik_dashboard.password,
+                        enable_https=True,
+                        domain_name=cluster_config.domain_name,
+                        secret_name='main-certificate-tls',  # noqa: S106 (not a secret)
+                    )
+                elif cluster_config.additional_components.traefik_dashboard.enabled:
+                    cluster.expose_traefik_dashboard(
+                        username=cluster_config.additional_components.traefik_dashboard.username,
+                        password=cluster_config.additional_components.traefik_dashboard.password,
+                        enable_https=False,
+                    )
 
-            if cluster_config.domain_name and cluster_config.additional_components.traefik_dashboard.enabled:
-                await cluster.install_certmanager(cluster_config.domain_name)
+                if cluster_config.additional_components.pg_operator.enabled:
+                    cluster.install_pg_operator()
+
+                # Check if only control-plane node was requested
+                if len(cluster_config.pools) > 1:
+                    # TODO: remove hardcoded node name
+                    cluster.cordon_node(f'{cluster_config.name}-control-plane-node-1')
+
+                await asyncio.to_thread(
+                    self.storage.update_cluster,
+                    cluster_id,
+                    {
+                        'status': DeploymentStatus.RUNNING,
+                        'kubeconfig_path': str(cluster.kubeconfig_path),
+                        'access_ip': cluster.access_ip,
+                    },
+                )
 
-                cluster.expose_traefik_dashboard(
-                    username=cluster_config.additional_components.traefik_dashboard.username,
-                    password=cluster_config.additional_components.traefik_dashboard.password,
-                    enable_https=True,
-                    domain_name=cluster_config.domain_name,
-                    secret_name='main-certificate-tls',  # noqa: S106 (not a secret)
+                self._logger.info('Cluster %s created', cluster_db.name)
+            except ResourceUnavailableError as e:
+                error_message = (
+                    f'{e!s}. Right now Hetzner does not have available machines for selected type/region. '
+                    f'Please try removing the cluster and creating it again later or '
+                    f'choose VM of different type / location.'
                 )
-            elif cluster_config.additional_components.traefik_dashboard.enabled:
-                cluster.expose_traefik_dashboard(
-                    username=cluster_config.additional_components.traefik_dashboard.username,
-                    password=cluster_config.additional_components.traefik_dashboard.password,
-                    enable_https=False,
+                await asyncio.to_thread(
+                    self.storage.update_cluster,
+                    cluster_id,
+                    {'status': DeploymentStatus.FAILED, 'error_message': error_message},
                 )
+            except Exception as e:
+                self._logger.exception('Error while creating cluster', exc_info=True)
 
-            if cluster_config.additional_components.pg_operator.enabled:
-                cluster.install_pg_operator()
-
-            # Check if only control-plane node was requested
-            if len(cluster_config.pools) > 1:
-                # TODO: remove hardcoded node name
-                cluster.cordon_node(f'{cluster_config.name}-control-plane-node-1')
-
-            self.storage.update_cluster(
-                cluster_id,
-                {
-                    'status': DeploymentStatus.RUNNING,
-                    'kubeconfig_path': str(cluster.kubeconfig_path),
-                    'access_ip': cluster.access_ip,
-                },
-            )
-
-            self._logger.info(f'Cluster {cluster_db.name} created')
-        except ResourceUnavailableError as e:
-            error_message = (
-                f'{e!s}. Right now Hetzner does not have available machines for selected type/region. '
-                f'Please try removing the cluster and creating it again later or '
-                f'choose VM of different type / location.'
-            )
-            self.storage.update_cluster(cluster_id, {'status': DeploymentStatus.FAILED, 'error_message': error_message})
-        except Exception as e:
-            self._logger.exception('Error while creating cluster', exc_info=True)
-
-            error_msg_formatted = re.sub(
-                r'WARNING: Kubernetes configuration file is (?:world|group)-readable\. '
-                r'This is insecure\. Location: .*\.yaml',
-                '',
-                str(e),
-            )
+                error_msg_formatted = _K8S_WARN_RE.sub('', str(e))
 
-            self.storage.update_cluster(
-                cluster_id, {'status': DeploymentStatus.FAILED, 'error_message': error_msg_formatted}
-            )
+                await asyncio.to_thread(
+                    self.storage.update_cluster,
+                    cluster_id,
+                    {'status': DeploymentStatus.FAILED, 'error_message': error_msg_formatted},
+                )
 
     async def create_volume(self, provider: str, volume_config: VolumeCreateSchema) -> None:
         provider = ProviderFactory.get_provider(provider)
@@ -128,21 +169,23 @@ class ClusterManager:
             size=volume_config.size,
             status=DeploymentStatus.CREATING,
         )
-        volume_id = self.storage.create_volume(volume)
+        volume_id = await asyncio.to_thread(self.storage.create_volume, volume)
 
         try:
             await provider.create_volume(volume_config.name, volume_config.size, volume_config.region)
 
-            self._logger.info(f'Volume {volume_config.name} created')
-            self.storage.update_volume(volume_id, {'status': DeploymentStatus.RUNNING})
+            self._logger.info('Volume %s created', volume_config.name)
+            await asyncio.to_thread(self.storage.update_volume, volume_id, {'status': DeploymentStatus.RUNNING})
         except Exception as e:
             self._logger.exception('Error while creating volume')
-            self.storage.update_volume(volume_id, {'status': DeploymentStatus.FAILED, 'error_message': str(e)})
+            await asyncio.to_thread(
+                self.storage.update_volume, volume_id, {'status': DeploymentStatus.FAILED, 'error_message': str(e)}
+            )
 
     def get_cluster_kubeconfig(self, cluster_id: int) -> str:
         kubeconfig_path = Path(self.storage.get_cluster(cluster_id).kubeconfig_path)
 
-        return kubeconfig_path.read_text()
+        return _read_kubeconfig(kubeconfig_path, kubeconfig_path.stat().st_mtime_ns)
 
     def get_cluster(self, cluster_id: int) -> type[Cluster]:
         return self.storage.get_cluster(cluster_id)
@@ -158,6 +201,7 @@ class ClusterManager:
         provider.delete_cluster()
 
         self.storage.delete_cluster(cluster_id)
+        self._invalidate_endpoint_cache(cluster_id)
 
     def get_applications(self) -> list[type[Application]]:
         return self.storage.get_applications()
@@ -169,7 +213,7 @@ class ClusterManager:
         return self.storage.get_volumes()
 
     def get_volume(self, volume_id: int) -> type[Volume]:
-        return self.get_volume(volume_id)
+        return self.storage.get_volume(volume_id)
 
     def delete_volume(self, volume_id: int) -> None:
         # TODO: parametrize provider
@@ -193,7 +237,10 @@ class ClusterManager:
             endpoints=[x.to_dict() for x in deployment_create.endpoints],
         )
 
-        return self.storage.create_deployment(deployment)
+        deployment_id = await asyncio.to_thread(self.storage.create_deployment, deployment)
+        self._invalidate_endpoint_cache(cluster_id)
+
+        return deployment_id
 
     async def create_deployment(
         self, cluster_id: int, deployment_id: int, deployment_create: DeploymentCreateSchema
@@ -203,112 +250,108 @@ class ClusterManager:
 
         deployment_config = deployment_create.config.copy()
 
-        self._logger.info(f'Deploying application to cluster {cluster_id}, config: {deployment_config}')
+        self._logger.info('Deploying application to cluster %s, config: %s', cluster_id, deployment_config)
 
-        cluster_from_db = self.get_cluster(cluster_id)
-
-        if not cluster_from_db:
-            msg = f'Cluster {cluster_id} was not found'
-            self._logger.exception(msg)
-            raise ValueError(msg)
-
-        cluster = KubernetesCluster.from_db_model(cluster_from_db)
+        # Bounded with cluster creation, so a burst of requests does not hit the provider and API servers at once
+        async with self._provisioning_semaphore:
+            cluster_from_db = await asyncio.to_thread(self.storage.get_cluster, cluster_id)
 
-        if node_pool:
-            cluster_pools = [x.name for x in cluster.config.pools]
-
-            if node_pool not in cluster_pools:
-                msg = f'Node pool {node_pool} does not exist in cluster {cluster_id}. Available pools: {cluster_pools}'
+            if not cluster_from_db:
+                msg = f'Cluster {cluster_id} was not found'
                 self._logger.exception(msg)
                 raise ValueError(msg)
 
-            if deployment_create.application_id == 1:
-                deployment_config['node_selector'] = {'pool': node_pool}
-
-        # for volume_requirement in volume_requirements:
-        #     if volume_requirement.volume_type == "new":
-        #         self._logger.info(f'Will create new volume as per requirement {volume_requirement}')
-        #         helm_chart_values['logs']['persistence']['size'] = f'{volume_requirement.size}Gi'
-        #     elif volume_requirement.volume_type == "existing":
-        #         self._logger.info(f'Will use existing volume as per requirement {volume_requirement}')
-        #         volumes = [x for x in self.storage.get_volumes() if x.name == volume_requirement.name]
-        #
-        #         if not volumes:
-        #             raise ValueError(f'Could not find volume {volume_requirement.name} in DB')
-        #         else:
-        #             volume = volumes[0]
-        #
-        #         helm_chart_values['logs']['persistence']['size'] = f'{volume.size}Gi'
-        #         helm_chart_values['logs']['persistence']['existingClaim'] = volume.name
-        #
-        #     else:
-        #         raise ValueError(f"Unknown volume requirement type: {volume_requirement.volume_type}")
+            cluster = KubernetesCluster.from_db_model(cluster_from_db)
 
-        try:
-            application_instance = ApplicationFactory.get_application(
-                deployment_create.application_id, deployment_config
-            )
-        except ValidationError as e:
-            self._logger.exception(f'Application config validation error: {e.errors()}', exc_info=False)
-            self.storage.update_deployment(
-                deployment_id,
-                {'status': DeploymentStatus.FAILED, 'error_message': f'Application config error: {e.errors()}'},
-            )
-            return
+            if node_pool:
+                if node_pool not in cluster.config.pool_names:
+                    msg = (
+                        f'Node pool {node_pool} does not exist in cluster {cluster_id}. '
+                        f'Available pools: {sorted(cluster.config.pool_names)}'
+                    )
+                    self._logger.exception(msg)
+                    raise ValueError(msg)
+
+                if deployment_create.application_id == 1:
+                    deployment_config['node_selector'] = {'pool': node_pool}
+
+            # for volume_requirement in volume_requirements:
+            #     if volume_requirement.volume_type == "new":
+            #         self._logger.info(f'Will create new volume as per requirement {volume_requirement}')
+            #         helm_chart_values['logs']['persistence']['size'] = f'{volume_requirement.size}Gi'
+            #     elif volume_requirement.volume_type == "existing":
+            #         self._logger.info(f'Will use existing volume as per requirement {volume_requirement}')
+            #         volume = self.storage.get_volume_by_name(volume_requirement.name)
+            #
+            #         if not volume:
+            #             raise ValueError(f'Could not find volume {volume_requirement.name} in DB')
+            #
+            #         helm_chart_values['logs']['persistence']['size'] = f'{volume.size}Gi'
+            #         helm_chart_values['logs']['persistence']['existingClaim'] = volume.name
+            #
+            #     else:
+            #         raise ValueError(f"Unknown volume requirement type: {volume_requirement.volume_type}")
+
+            try:
+                application_instance = ApplicationFactory.get_application(
+                    deployment_create.application_id, deployment_config
+                )
+            except ValidationError as e:
+                self._logger.exception(f'Application config validation error: {e.errors()}', exc_info=False)
+                await asyncio.to_thread(
+                    self.storage.update_deployment,
+                    deployment_id,
+                    {'status': DeploymentStatus.FAILED, 'error_message': f'Application config error: {e.errors()}'},
+                )
+                return
 
-        helm_chart = application_instance.get_helm_chart()
-        helm_chart_values = application_instance.chart_values.copy()
+            helm_chart = application_instance.get_helm_chart()
+            helm_chart_values = application_instance.chart_values
 
-        namespace = f'{helm_chart.name.split("/")[-1]}-{deployment_id}'
-        self.storage.update_deployment(deployment_id, {'namespace': namespace})
+            namespace = f'{helm_chart.name.split("/")[-1]}-{deployment_id}'
+            await asyncio.to_thread(self.storage.update_deployment, deployment_id, {'namespace': namespace})
 
-        cluster.create_namespace(namespace)
+            cluster.create_namespace(namespace)
 
-        access_endpoints_values = application_instance.get_ingress_helm_values(
-            deployment_create.endpoints, cluster.access_ip, namespace
-        )
+            access_endpoints_values = application_instance.get_ingress_helm_values(
+                deployment_create.endpoints, cluster.access_ip, namespace
+            )
 
-        helm_chart_values = {**helm_chart_values, **access_endpoints_values}
+            helm_chart_values = {**helm_chart_values, **access_endpoints_values}
 
-        try:
-            await application_instance.run_pre_install_actions(cluster, namespace, deployment_config)
+            try:
+                await application_instance.run_pre_install_actions(cluster, namespace, deployment_config)
 
-            await cluster.install_or_upgrade_chart(helm_chart, helm_chart_values, namespace)
+                await cluster.install_or_upgrade_chart(helm_chart, helm_chart_values, namespace)
 
-            self._logger.info(
-                f'Successfully deployed app {deployment_create.application_id} to cluster {cluster_from_db.name}'
-            )
-            self.storage.update_deployment(deployment_id, {'status': DeploymentStatus.RUNNING})
+                self._logger.info(
+                    'Successfully deployed app %s to cluster %s', deployment_create.application_id, cluster_from_db.name
+                )
+                await asyncio.to_thread(
+                    self.storage.update_deployment, deployment_id, {'status': DeploymentStatus.RUNNING}
+                )
 
-            await application_instance.run_post_install_actions(
-                cluster, namespace, {**deployment_config, **access_endpoints_values}
-            )
-        except Exception as e:
-            self._logger.exception('Error during application deployment', exc_info=True)
-            error_msg_formatted = re.sub(
-                r'WARNING: Kubernetes configuration file is (?:world|group)-readable\. '
-                r'This is insecure\. Location: .*\.yaml',
-                '',
-                str(e),
-            )
-            self.storage.update_deployment(
-                deployment_id, {'status': DeploymentStatus.FAILED, 'error_message': error_msg_formatted}
-            )
+                # deployment_config is a local copy that is not used afterwards, so it can be extended in place
+                deployment_config.update(access_endpoints_values)
+                await application_instance.run_post_install_actions(cluster, namespace, deployment_config)
+            except Exception as e:
+                self._logger.exception('Error during application deployment', exc_info=True)
+                error_msg_formatted = _K8S_WARN_RE.sub('', str(e))
+                await asyncio.to_thread(
+                    self.storage.update_deployment,
+                    deployment_id,
+                    {'status': DeploymentStatus.FAILED, 'error_message': error_msg_formatted},
+                )
 
     async def update_deployment(self, cluster_id: int, deployment_id: int, deployment_config: dict) -> None:
-        cluster_from_db = self.get_cluster(cluster_id)
+        deployment_from_db = await asyncio.to_thread(self.storage.get_deployment_with_cluster, deployment_id)
 
-        if not cluster_from_db:
-            msg = f'Cluster {cluster_id} was not found'
+        if not deployment_from_db or deployment_from_db.cluster_id != cluster_id:
+            msg = f'Deployment {deployment_id} was not found in cluster {cluster_id}'
             self._logger.exception(msg)
             raise ValueError(msg)
 
-        deployment_from_db = self.get_deployment(deployment_id)
-
-        if not deployment_from_db:
-            msg = f'Deployment {deployment_id} was not found'
-            self._logger.exception(msg)
-            raise ValueError(msg)
+        cluster_from_db = deployment_from_db.cluster
 
         cluster = KubernetesCluster.from_db_model(cluster_from_db)
 
@@ -317,36 +360,42 @@ class ClusterManager:
 
         application_instance = ApplicationFactory.get_application(deployment_from_db.application_id, deployment_config)
 
-        self.storage.update_deployment(
-            deployment_id, {'status': DeploymentStatus.UPDATING, 'config': deployment_config}
+        await asyncio.to_thread(
+            self.storage.update_deployment,
+            deployment_id,
+            {'status': DeploymentStatus.UPDATING, 'config': deployment_config},
         )
+        self._invalidate_endpoint_cache(cluster_id)
 
         try:
             await cluster.install_or_upgrade_chart(
                 application_instance.get_helm_chart(), application_instance.chart_values, deployment_from_db.namespace
             )
 
-            self._logger.info(f'Successfully updated application {application_instance.name} {cluster_from_db.name}')
-            self.storage.update_deployment(deployment_id, {'status': DeploymentStatus.RUNNING})
+            self._logger.info('Successfully updated application %s %s', application_instance.name, cluster_from_db.name)
+            await asyncio.to_thread(self.storage.update_deployment, deployment_id, {'status': DeploymentStatus.RUNNING})
         except Exception as e:
             self._logger.exception('Error while updating application', exc_info=True)
-            self.storage.update_deployment(deployment_id, {'status': DeploymentStatus.FAILED, 'error_message': str(e)})
+            await asyncio.to_thread(
+                self.storage.update_deployment,
+                deployment_id,
+                {'status': DeploymentStatus.FAILED, 'error_message': str(e)},
+            )
 
     async def remove_deployment(self, deployment_id: int) -> None:
-        deployment_from_db = self.get_deployment(deployment_id)
+        deployment_from_db = await asyncio.to_thread(self.storage.get_deployment_with_cluster, deployment_id)
 
         if not deployment_from_db:
             raise ValueError(f'Deployment {deployment_id} was not found')
 
-        cluster_from_db = self.get_cluster(deployment_from_db.cluster_id)
-
-        cluster = KubernetesCluster.from_db_model(cluster_from_db)
+        cluster = KubernetesCluster.from_db_model(deployment_from_db.cluster)
 
         helm_chart = ApplicationFactory.get_application_class(deployment_from_db.application_id).get_helm_chart()
 
         await cluster.uninstall_chart(helm_chart, deployment_from_db.namespace)
 
-        self.storage.delete_deployment(deployment_id)
+        await asyncio.to_thread(self.storage.delete_deployment, deployment_id)
+        self._invalidate_endpoint_cache(deployment_from_db.cluster_id)
 
     def get_deployments(self, cluster_id: int) -> list[type[Deployment]]:
         return self.storage.get_deployments(cluster_id)
@@ -355,16 +404,14 @@ class ClusterManager:
         return self.storage.get_deployment(deployment_id)
 
     def get_deployment_initial_credentials(self, deployment_id: int) -> dict:
-        deployment = self.get_deployment(deployment_id)
+        deployment = self.storage.get_deployment_with_cluster(deployment_id)
 
         if not deployment:
             msg = f'Deployment {deployment_id} was not found'
             self._logger.exception(msg)
             raise ValueError(msg)
 
-        cluster_from_db = self.get_cluster(deployment.cluster_id)
-
-        cluster = KubernetesCluster.from_db_model(cluster_from_db)
+        cluster = KubernetesCluster.from_db_model(deployment.cluster)
         application_id = deployment.application_id
 
         application = ApplicationFactory.get_application_class(application_id)
@@ -377,29 +424,54 @@ class ClusterManager:
             'password': secret[application_metadata.password_key],
         }
 
-    def get_existing_endpoints(self, cluster_id: int) -> dict:
-        deployments = self.storage.get_deployments(cluster_id)
-
-        existing_cluster_ip_path_endpoints = []
-        existing_domain_path_endpoints = []
-        existing_subdomain_endpoints = []
-
-        for deployment in deployments:
-            for endpoint in deployment.endpoints:
-                if endpoint['access_type'] == AccessEndpointType.CLUSTER_IP_PATH:
-                    existing_cluster_ip_path_endpoints.append(endpoint['value'])
-                elif endpoint['access_type'] == AccessEndpointType.DOMAIN_PATH:
-                    existing_domain_path_endpoints.append(endpoint['value'])
-                elif endpoint['access_type'] == AccessEndpointType.SUBDOMAIN:
-                    existing_subdomain_endpoints.append(endpoint['value'])
-                else:
-                    raise ValueError(
-                        f'Unknown access type {endpoint["access_type"]} for '
-                        f'endpoint {endpoint["name"]} in deployment {deployment.name}'
-                    )
+    def _invalidate_endpoint_cache(self, cluster_id: int) -> None:
+        with self._endpoint_cache_lock:
+            self._endpoint_cache.pop(cluster_id, None)
+            self._endpoint_cache_generations[cluster_id] = self._endpoint_cache_generations.get(cluster_id, 0) + 1
 
-        return {
-            AccessEndpointType.CLUSTER_IP_PATH: existing_cluster_ip_path_endpoints,
-            AccessEndpointType.DOMAIN_PATH: existing_domain_path_endpoints,
-            AccessEndpointType.SUBDOMAIN: existing_subdomain_endpoints,
-        }
+    def get_existing_endpoints(self, cluster_id: int) -> Mapping[AccessEndpointType, frozenset[str]]:
+        with self._endpoint_cache_lock:
+            if (cached_endpoints := self._endpoint_cache.get(cluster_id)) is not None:
+                return cached_endpoints
+
+            generation = self._endpoint_cache_generations.get(cluster_id, 0)
+
+        # Loaded without holding the lock, so a slow query does not stall invalidations from other threads
+        existing_endpoints = {access_type: set() for access_type in AccessEndpointType}
+
+        endpoints = self.storage.get_endpoints_for_cluster(cluster_id)
+
+        for deployment_name, endpoint_name, access_type, value in endpoints:
+            # Stored access types are plain strings, which hash and compare equal to the StrEnum keys
+            try:
+                existing_endpoints[access_type].add(value)
+            except KeyError:
+                raise ValueError(
+                    f'Unknown access type {access_type} for endpoint {endpoint_name} in deployment {deployment_name}'
+                ) from None
+
+        # Read-only, as the same object is handed to every caller until the next invalidation
+        frozen_endpoints = MappingProxyType(
+            {access_type: frozenset(values) for access_type, values in existing_endpoints.items()}
+        )
+
+        with self._endpoint_cache_lock:
+            if self._endpoint_cache_generations.get(cluster_id, 0) == generation:
+                self._endpoint_cache[cluster_id] = frozen_endpoints
+
+        return frozen_endpoints
+
+
+_cluster_manager_lock = threading.Lock()
+
+
+@functools.cache
+def _create_cluster_manager() -> ClusterManager:
+    return ClusterManager()
+
+
+def get_cluster_manager() -> ClusterManager:
+    # Dependency shared by the API routers; built on first use rather than at import, so importing the routers does
+    # not create the database. The lock keeps concurrent first requests from building two instances
+    with _cluster_manager_lock:
+        return _create_cluster_manager()
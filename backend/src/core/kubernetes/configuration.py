@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 
 from src.api.schemas import ClusterAdditionalComponents, ClusterPool
 
@@ -12,3 +13,7 @@ class ClusterConfiguration:
     domain_name: str | None
     pools: list[ClusterPool] = field(default_factory=list)
     additional_components: ClusterAdditionalComponents = field(default_factory=dict)
+
+    @cached_property
+    def pool_names(self) -> frozenset[str]:
+        return frozenset(pool.name for pool in self.pools)
@@ -10,7 +10,7 @@ import yaml
 from kubernetes import client, config, utils
 from kubernetes.client import ApiException, Configuration
 from kubernetes.dynamic.client import DynamicClient
-from kubernetes.dynamic.exceptions import NotFoundError
+from kubernetes.dynamic.exceptions import NotFoundError, ResourceNotFoundError
 from kubernetes.stream import stream
 from src.core.utils import setup_logger
 
@@ -74,13 +74,24 @@ class KubernetesClient:
         if path_to_yaml.is_dir():
             utils.create_from_directory(self._clients.custom_objects, str(path_to_yaml))
         else:
-            if with_custom_objects:
-                self._logger.debug('Applying custom objects...')
-                manifest = yaml.safe_load(path_to_yaml.read_text())
-                self._apply_simple_item(manifest)
-            else:
-                manifest = list(yaml.safe_load_all(path_to_yaml.read_text()))
-                utils.create_from_yaml(self._clients.api, yaml_objects=manifest)
+            self.install_from_string(path_to_yaml.read_text(), with_custom_objects)
+
+    def install_from_string(self, yaml_content: str, with_custom_objects: bool = False) -> None:
+        if with_custom_objects:
+            self._logger.debug('Applying custom objects...')
+            manifest = yaml.safe_load(yaml_content)
+            self._apply_simple_item(manifest)
+        else:
+            manifest = list(yaml.safe_load_all(yaml_content))
+            utils.create_from_yaml(self._clients.api, yaml_objects=manifest)
+
+    def has_resource(self, api_version: str, kind: str) -> bool:
+        # A miss refreshes the discovery cache, so resources registered since the last lookup are found
+        try:
+            self._clients.dynamic.resources.get(api_version=api_version, kind=kind)
+        except ResourceNotFoundError:
+            return False
+        return True
 
     def _apply_simple_item(self, manifest: dict, verbose: bool = False) -> None:
         api_version = manifest.get('apiVersion')
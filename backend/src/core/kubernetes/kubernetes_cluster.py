@@ -1,8 +1,11 @@
 import base64
+import functools
 import json
+import logging
 from pathlib import Path
 from typing import Any, Literal
 
+import urllib3
 from kubernetes.client.exceptions import ApiException
 from src.api.schemas import ClusterPool
 from src.core.apps.other import certmanager_chart, cluster_autoscaler_chart, longhorn_chart
@@ -14,18 +17,42 @@ from src.core.kubernetes.kubernetes_client import KubernetesClient
 from src.core.template_loader import template_loader
 from src.core.utils import encrypt_password, setup_logger
 from src.database.models import Cluster
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential,
+    wait_fixed,
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_kubernetes_client(kubeconfig_path: Path, kubeconfig_mtime_ns: int) -> KubernetesClient:
+    # Creating a client loads the kubeconfig and runs API discovery for the dynamic client, so clients are reused
+    # across requests; the mtime is part of the key so a rewritten kubeconfig gets a fresh client
+    return KubernetesClient(kubeconfig_path)
 
 
 class KubernetesCluster:
-    def __init__(self, config: ClusterConfiguration, access_ip: str, kubeconfig_path: Path) -> None:
-        self._logger = setup_logger('KubernetesCluster')
+    _logger: logging.Logger = setup_logger('KubernetesCluster')
 
+    def __init__(self, config: ClusterConfiguration, access_ip: str, kubeconfig_path: Path) -> None:
         self.config = config
         self.access_ip = access_ip
         self.kubeconfig_path = kubeconfig_path
-        self._client = KubernetesClient(kubeconfig_path)
-        self._helm_client = HelmClient(kubeconfig=kubeconfig_path)
+
+    # Clients are created on first use, so callers that only need the cluster config do not touch the kubeconfig
+
+    @functools.cached_property
+    def _client(self) -> KubernetesClient:
+        kubeconfig_path = Path(self.kubeconfig_path)
+        return _get_kubernetes_client(kubeconfig_path, kubeconfig_path.stat().st_mtime_ns)
+
+    @functools.cached_property
+    def _helm_client(self) -> HelmClient:
+        return HelmClient(kubeconfig=self.kubeconfig_path)
 
     def _parse_kubernetes_api_exception(self, exception: ApiException) -> tuple[str, str]:
         original_reason = exception.reason
@@ -181,6 +208,18 @@ class KubernetesCluster:
         await self.install_or_upgrade_chart(cluster_autoscaler_chart, values, namespace='kube-system')
         self._logger.info('Installed ClusterAutoscaler successfully')
 
+    @retry(
+        # Discovery goes through the API server, which may still be restarting while k3s registers the CRDs
+        retry=retry_if_result(lambda ready: not ready)
+        | retry_if_exception_type((ApiException, urllib3.exceptions.HTTPError, ConnectionError)),
+        wait=wait_exponential(multiplier=0.5, max=5),
+        stop=stop_after_delay(30),
+        retry_error_callback=lambda _: False,
+    )
+    async def wait_for_traefik_crds(self) -> bool:
+        # k3s installs the Traefik CRDs shortly after the API server is up; objects using them fail with 404 until then
+        return all(self._client.has_resource('traefik.io/v1alpha1', kind) for kind in ('IngressRoute', 'Middleware'))
+
     def expose_traefik_dashboard(
         self,
         username: str,
@@ -211,14 +250,13 @@ class KubernetesCluster:
             'middleware_name': middleware_name,
         }
 
-        with template_loader.render_to_temp_file(
-            'traefik-basic-auth-middleware.yaml', values, 'kubernetes'
-        ) as rendered_template_file:
-            try:
-                self._client.install_from_yaml(rendered_template_file, with_custom_objects=True)
-                self._logger.info('Traefik basic auth middleware applied successfully!')
-            except Exception:
-                self._logger.exception('Failed to apply Traefik basic auth middleware', exc_info=True)
+        rendered_template = template_loader.render_template('traefik-basic-auth-middleware.yaml', 'kubernetes', values)
+
+        try:
+            self._client.install_from_string(rendered_template, with_custom_objects=True)
+            self._logger.info('Traefik basic auth middleware applied successfully!')
+        except Exception:
+            self._logger.exception('Failed to apply Traefik basic auth middleware', exc_info=True)
 
         values = {
             'enable_https': enable_https,
@@ -227,14 +265,15 @@ class KubernetesCluster:
             'middleware_name': middleware_name,
         }
 
-        with template_loader.render_to_temp_file(
-            'traefik-dashboard-ingress-route.yaml', values, 'kubernetes'
-        ) as rendered_template_file:
-            try:
-                self._client.install_from_yaml(rendered_template_file, with_custom_objects=True)
-                self._logger.info('Traefik dashboard exposed successfully!')
-            except Exception:
-                self._logger.exception('Failed to expose Traefik dashboard', exc_info=True)
+        rendered_template = template_loader.render_template(
+            'traefik-dashboard-ingress-route.yaml', 'kubernetes', values
+        )
+
+        try:
+            self._client.install_from_string(rendered_template, with_custom_objects=True)
+            self._logger.info('Traefik dashboard exposed successfully!')
+        except Exception:
+            self._logger.exception('Failed to expose Traefik dashboard', exc_info=True)
 
     def _add_acme_certificate_issuer(self, issuer_type: Literal['staging', 'prod'] = 'prod') -> None:
         path_to_template = template_loader.get_template(f'cert-manager-acme-issuer-{issuer_type}.yaml', 'kubernetes')
@@ -263,14 +302,13 @@ class KubernetesCluster:
             'issuer_name': f'acme-{issuer_type}',
         }
 
-        with template_loader.render_to_temp_file(
-            'cert-manager-acme-certificate.yaml', values, 'kubernetes'
-        ) as rendered_template_file:
-            try:
-                self._client.install_from_yaml(rendered_template_file, with_custom_objects=True)
-                self._logger.info('Certificate successfully created!')
-            except Exception:
-                self._logger.exception('Failed to create certificate', exc_info=True)
+        rendered_template = template_loader.render_template('cert-manager-acme-certificate.yaml', 'kubernetes', values)
+
+        try:
+            self._client.install_from_string(rendered_template, with_custom_objects=True)
+            self._logger.info('Certificate successfully created!')
+        except Exception:
+            self._logger.exception('Failed to create certificate', exc_info=True)
 
     def install_csi(self, provider: str) -> None:
         path_to_template = template_loader.get_template(f'{provider}-csi.yaml', 'kubernetes')
@@ -313,6 +351,14 @@ class KubernetesCluster:
             self._logger.exception(f'Failed to apply file {path_to_template}', exc_info=False)
             raise
 
+    def apply_manifest(self, manifest: str, with_custom_objects: bool = False) -> None:
+        try:
+            self._client.install_from_string(manifest, with_custom_objects)
+            self._logger.info('Applied manifest successfully!')
+        except Exception:
+            self._logger.exception('Failed to apply manifest', exc_info=False)
+            raise
+
     def create_object_from_content(self, yaml_content: dict | list[dict]) -> None:
         self._client.install_from_content(yaml_content)
 
@@ -1,6 +1,3 @@
-import tempfile
-from collections.abc import Generator
-from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -24,7 +21,11 @@ class TemplateLoader:
                 "Please ensure a 'templates' folder exists next to your script."
             )
 
-        self._environment = Environment(loader=FileSystemLoader(templates_dir), autoescape=True)
+        # Templates are shipped with the package and never change at runtime, so skip up-to-date checks on cache hits
+        self._environment = Environment(loader=FileSystemLoader(templates_dir), autoescape=True, auto_reload=False)
+
+        # template path -> names of variables referenced in it
+        self._template_variables: dict[str, frozenset[str]] = {}
 
     def _validate_template_module(self, template_module: str | None) -> str:
         if template_module is not None and template_module not in self._TEMPLATE_SUBFOLDERS:
@@ -44,6 +45,15 @@ class TemplateLoader:
                 "Please ensure the template file exists in the correct path relative to the 'templates' directory."
             ) from e
 
+    def _get_template_variables(self, template_full_path: str) -> frozenset[str]:
+        if template_full_path not in self._template_variables:
+            template_source = self._environment.loader.get_source(self._environment, template_full_path)[0]
+            parsed_ast = self._environment.parse(template_source)
+
+            self._template_variables[template_full_path] = frozenset(meta.find_undeclared_variables(parsed_ast))
+
+        return self._template_variables[template_full_path]
+
     def get_template(self, template_name: str, template_module: str | None = None) -> Path:
         resolved_template_module = self._validate_template_module(template_module)
 
@@ -68,11 +78,7 @@ class TemplateLoader:
         template = self._search_template(template_full_path)
 
         if values:
-            template_source = self._environment.loader.get_source(self._environment, template_full_path)[0]
-            parsed_ast = self._environment.parse(template_source)
-            template_variables = meta.find_undeclared_variables(parsed_ast)
-
-            undeclared_variables = template_variables - values.keys()
+            undeclared_variables = self._get_template_variables(template_full_path) - values.keys()
 
             if undeclared_variables:
                 raise ValueError(
@@ -82,26 +88,5 @@ class TemplateLoader:
 
         return template.render(**values)
 
-    @contextmanager
-    def render_to_temp_file(
-        self, template_name: str, values: dict[str, Any], template_module: str | None = None
-    ) -> Generator[Path, None, None]:
-        rendered_content = self.render_template(template_name, template_module, values)
-
-        temp_file_path = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode='w', delete=False, suffix='.tmp', prefix='rendered_template_', encoding='utf-8'
-            ) as temp_file_object:
-                temp_file_path = temp_file_object.name
-
-                temp_file_object.write(rendered_content)
-
-            yield Path(temp_file_object.name)
-
-        finally:
-            if temp_file_path:
-                Path(temp_file_path).unlink(missing_ok=True)
-
 
 template_loader = TemplateLoader()
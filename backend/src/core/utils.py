@@ -1,8 +1,27 @@
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import secrets
 import string
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
 
 import bcrypt
+import httpx
+
+# Shared client so version lookups reuse pooled connections to the GitHub API
+_github_client = httpx.AsyncClient(
+    base_url='https://api.github.com', headers={'Accept': 'application/vnd.github+json'}, timeout=15
+)
+
+# Release tags are cached on disk, so restarted processes don't hit the (unauthenticated, 60/hour) rate limit again
+_GITHUB_CACHE_DIR = Path(tempfile.gettempdir(), 'datainfrapilot', 'github')
+_GITHUB_CACHE_TTL_SECONDS = 3600
 
 
 def setup_logger(logger_name: str) -> logging.Logger:
@@ -31,3 +50,87 @@ def encrypt_password(username: str, password: str) -> str:
     bcrypted = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=12)).decode('utf-8')
 
     return f'{username}:{bcrypted}'
+
+
+def async_cache(
+    ttl_seconds: float | None = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Like functools.cache, but for coroutine functions (stores the awaited result rather than the coroutine).
+
+    Entries older than ttl_seconds are recomputed on the next call; without a TTL they are kept forever.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args) -> Any:  # noqa: ANN401 (returns whatever the wrapped coroutine returns)
+            entry = cache.get(args)
+
+            if entry is None or (ttl_seconds is not None and time.monotonic() - entry[0] >= ttl_seconds):
+                entry = cache[args] = (time.monotonic(), await func(*args))
+
+            return entry[1]
+
+        wrapper.cache_clear = cache.clear
+
+        return wrapper
+
+    return decorator
+
+
+def _read_github_cache(cache_file: Path) -> tuple[dict | None, bool]:
+    """Return the cached {etag, tags} entry and whether it is still fresh; unreadable entries count as a miss."""
+    try:
+        cached = json.loads(cache_file.read_text())
+        is_fresh = time.time() - cache_file.stat().st_mtime < _GITHUB_CACHE_TTL_SECONDS
+    except (OSError, ValueError):
+        return None, False
+
+    if not isinstance(cached, dict) or not isinstance(cached.get('tags'), list):
+        return None, False
+
+    return cached, is_fresh
+
+
+def _write_github_cache(cache_file: Path, entry: dict) -> None:
+    # Written to a sibling temp file and renamed, so concurrent readers never see a half-written entry
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile('w', dir=cache_file.parent, suffix='.tmp', delete=False) as tmp_file:
+        json.dump(entry, tmp_file)
+
+    tmp_path = Path(tmp_file.name)
+
+    try:
+        tmp_path.replace(cache_file)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+async def get_github_release_tags(repository: str, params: dict | None = None) -> list[str]:
+    url = _github_client.build_request('GET', f'/repos/{repository}/releases', params=params).url
+    cache_file = _GITHUB_CACHE_DIR / f'{hashlib.sha256(str(url).encode()).hexdigest()}-tags.json'
+
+    cached, is_fresh = await asyncio.to_thread(_read_github_cache, cache_file)
+
+    if cached and is_fresh:
+        return cached['tags']
+
+    # Conditional request: 304 responses do not count against the rate limit
+    headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else {}
+
+    response = await _github_client.get(url, headers=headers)
+
+    if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+        await asyncio.to_thread(cache_file.touch)
+        return cached['tags']
+
+    response.raise_for_status()
+    # Releases carry assets, authors and notes; only the tag names are kept and cached
+    tags = [release['tag_name'] for release in response.json()]
+
+    await asyncio.to_thread(_write_github_cache, cache_file, {'etag': response.headers.get('ETag'), 'tags': tags})
+
+    return tags
@@ -1,17 +1,58 @@
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import Engine, create_engine, event, func, make_url, true
 from sqlalchemy.orm import joinedload, sessionmaker
 
 from src.database.handlers.base_database_handler import BaseDatabaseHandler
 from src.database.models import Application, BaseModel, Cluster, Deployment, Volume
 
+# WAL lets the API read while a background deployment is writing; busy_timeout waits for the writer lock instead of
+# failing with SQLITE_BUSY, and NORMAL sync is durable enough in WAL mode
+_SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:  # noqa: ANN001
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _create_read_only_engine(db_url: str) -> Engine | None:
+    url = make_url(db_url)
+    if not url.database or url.database == ':memory:':
+        return None
+
+    # Opened read-only through an SQLite URI, so reader connections can never take the write lock
+    read_only_url = url.set(database=f'file:{url.database}', query={'mode': 'ro', 'uri': 'true'})
+    engine = create_engine(read_only_url, pool_size=os.cpu_count() or 5)
+    event.listen(engine, 'connect', _set_sqlite_pragmas)
+
+    return engine
+
 
 class SQLiteHandler(BaseDatabaseHandler):
     def __init__(self, db_url: str) -> None:
         self.engine = create_engine(db_url)
+        event.listen(self.engine, 'connect', _set_sqlite_pragmas)
 
         BaseModel.metadata.create_all(self.engine)
+        # create_all only creates indexes along with their table, so indexes added to existing tables are created here
+        for table in BaseModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
         self.session = sessionmaker(bind=self.engine)
 
+        # Lookups go through a separate read-only pool, so API reads do not queue behind background writes
+        self.read_engine = _create_read_only_engine(db_url) or self.engine
+        self.read_session = sessionmaker(bind=self.read_engine)
+
         if not self.session().query(Application).count():
             initial_apps = [
                 Application(
@@ -35,13 +76,13 @@ class SQLiteHandler(BaseDatabaseHandler):
             return cluster_id
 
     def get_cluster(self, cluster_id: int) -> type[Cluster] | None:
-        with self.session() as session:
+        with self.read_session() as session:
             cluster = session.query(Cluster).filter_by(id=cluster_id).options(joinedload(Cluster.deployments)).first()
 
             return cluster or None
 
     def get_clusters(self) -> list[type[Cluster]]:
-        with self.session() as session:
+        with self.read_session() as session:
             clusters = session.query(Cluster).options(joinedload(Cluster.deployments)).all()
 
             return clusters
@@ -59,13 +100,13 @@ class SQLiteHandler(BaseDatabaseHandler):
             session.commit()
 
     def get_application(self, application_id: int) -> type[Application] | None:
-        with self.session() as session:
+        with self.read_session() as session:
             application = session.query(Application).filter_by(id=application_id).first()
 
             return application or None
 
     def get_applications(self) -> list[type[Application]]:
-        with self.session() as session:
+        with self.read_session() as session:
             applications = session.query(Application).all()
 
             return applications
@@ -85,13 +126,19 @@ class SQLiteHandler(BaseDatabaseHandler):
             session.commit()
 
     def get_volume(self, volume_id: int) -> type[Volume] | None:
-        with self.session() as session:
+        with self.read_session() as session:
             volume = session.query(Volume).filter_by(id=volume_id).first()
 
             return volume or None
 
+    def get_volume_by_name(self, volume_name: str) -> type[Volume] | None:
+        with self.read_session() as session:
+            volume = session.query(Volume).filter_by(name=volume_name).first()
+
+            return volume or None
+
     def get_volumes(self) -> list[type[Volume]]:
-        with self.session() as session:
+        with self.read_session() as session:
             volumes = session.query(Volume).all()
 
             return volumes
@@ -125,17 +172,44 @@ class SQLiteHandler(BaseDatabaseHandler):
             session.commit()
 
     def get_deployments(self, cluster_id: int) -> list[type[Deployment]]:
-        with self.session() as session:
-            deployments = (
-                session.query(Deployment)
-                .options(joinedload(Deployment.cluster), joinedload(Deployment.application))
-                .filter_by(cluster_id=cluster_id)
-                .all()
-            )
+        with self.read_session() as session:
+            # Single query over deployment columns only (config/endpoints are JSON columns). Cluster and application
+            # are not eagerly joined, as that would repeat the whole cluster row for every deployment
+            deployments = session.query(Deployment).filter_by(cluster_id=cluster_id).all()
+
             return deployments
 
     def get_deployment(self, deployment_id: int) -> type[Deployment] | None:
-        with self.session() as session:
+        with self.read_session() as session:
             deployment = session.query(Deployment).filter_by(id=deployment_id).first()
 
             return deployment or None
+
+    def get_deployment_with_cluster(self, deployment_id: int) -> type[Deployment] | None:
+        with self.read_session() as session:
+            # Load the owning cluster in the same query, as callers need both to act on the deployment
+            deployment = (
+                session.query(Deployment).filter_by(id=deployment_id).options(joinedload(Deployment.cluster)).first()
+            )
+
+            return deployment or None
+
+    def get_endpoints_for_cluster(self, cluster_id: int) -> list[tuple[str, str, str, str]]:
+        with self.read_session() as session:
+            # Unnest the endpoints JSON in SQLite, so only (deployment, name, access type, value) rows are read back
+            # instead of whole deployment rows with their configs
+            endpoint = func.json_each(Deployment.endpoints).table_valued('value')
+            rows = (
+                session.query(
+                    Deployment.name,
+                    func.json_extract(endpoint.c.value, '$.name'),
+                    func.json_extract(endpoint.c.value, '$.access_type'),
+                    func.json_extract(endpoint.c.value, '$.value'),
+                )
+                .select_from(Deployment)
+                .join(endpoint, true())
+                .filter(Deployment.cluster_id == cluster_id)
+                .all()
+            )
+
+            return [tuple(row) for row in rows]
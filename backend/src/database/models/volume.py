@@ -13,7 +13,7 @@ class Volume(BaseModel):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, init=False)
     provider: Mapped[str] = mapped_column(nullable=False)
     region: Mapped[str] = mapped_column(nullable=False)
-    name: Mapped[str] = mapped_column(nullable=False)
+    name: Mapped[str] = mapped_column(nullable=False, index=True)
     size: Mapped[int] = mapped_column(nullable=False)
     status: Mapped[str] = mapped_column(nullable=False)
     error_message: Mapped[str] = mapped_column(nullable=True, default='')
@@ -0,0 +1,46 @@
+import pytest
+
+from src.database.handlers.sqlite_handler import SQLiteHandler
+from src.database.models import Cluster, Deployment
+
+
+@pytest.fixture
+def sqlite_handler(tmp_path):
+    handler = SQLiteHandler(f'sqlite:///{tmp_path / "app.db"}')
+    yield handler
+    handler.read_engine.dispose()
+    handler.engine.dispose()
+
+
+@pytest.fixture
+def add_cluster(sqlite_handler):
+    def _add_cluster(name='cluster'):
+        return sqlite_handler.create_cluster(
+            Cluster(
+                name=name,
+                k3s_version='v1.32.4+k3s1',
+                provider='hetzner',
+                provider_config={},
+                additional_components={},
+                pools=[],
+                status='running',
+            )
+        )
+
+    return _add_cluster
+
+
+@pytest.fixture
+def add_deployment(sqlite_handler):
+    def _add_deployment(cluster_id, name='deployment', endpoints=(), application_id=1):
+        return sqlite_handler.create_deployment(
+            Deployment(
+                name=name,
+                cluster_id=cluster_id,
+                application_id=application_id,
+                namespace=f'{name}-ns',
+                endpoints=list(endpoints),
+            )
+        )
+
+    return _add_deployment
@@ -0,0 +1,172 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from src.core.apps.airflow_application import AirflowApplication, AirflowConfig, AirflowExecutor, _registry_host_url
+from src.core.apps.application_factory import ApplicationFactory
+
+AIRFLOW_APP_ID = 1
+VALID_CONFIG = {
+    'version': '2.10.5',
+    'dags_repository': 'https://github.com/example/dags.git',
+    'instance_name': 'analytics',
+}
+
+
+class LegacyAirflowConfig(BaseModel):
+    """AirflowConfig as it was before the field validators, with the patterns declared on the fields."""
+
+    model_config = ConfigDict(regex_engine='rust-regex')
+
+    version: str = Field(pattern=r'^\d\.\d{1,2}\.\d$')
+    use_custom_image: bool = False
+    private_registry_url: str | None = None
+    private_registry_username: str | None = None
+    private_registry_password: str | None = None
+    private_registry_image_tag: str | None = None
+    node_selector: dict | None = Field(default=None)
+    dags_repository: str = Field(pattern=r'^https://[A-Za-z0-9._~:/-]{10,}\.git$')
+    dags_repository_ssh_private_key: str | None = Field(default=None)
+    dags_repository_branch: str = Field(default='main')
+    dags_repository_subpath: str = Field(default='dags')
+    executor: AirflowExecutor = AirflowExecutor.CeleryExecutor
+    flower_enabled: bool = False
+    pgbouncer_enabled: bool = False
+    instance_name: str = Field(max_length=20)
+
+
+def is_valid(config_class, **overrides):
+    try:
+        config_class.model_validate(VALID_CONFIG | overrides)
+    except ValidationError:
+        return False
+    return True
+
+
+@pytest.fixture
+def airflow_registered():
+    with patch.dict(ApplicationFactory._registry, clear=True):
+        ApplicationFactory.register_application(AIRFLOW_APP_ID, AirflowApplication, AirflowConfig)
+        yield
+
+
+class TestRegistryHostUrl:
+    @pytest.mark.parametrize(
+        ('registry_url', 'expected'),
+        [
+            ('registry.example.com:5000/team/airflow', 'registry.example.com:5000'),
+            ('registry.example.com', 'registry.example.com'),
+            ('registry.example.com/', 'registry.example.com'),
+            ('https://registry.example.com/team/airflow', 'https://registry.example.com'),
+            ('https://registry.example.com:5000/team/airflow', 'https://registry.example.com:5000'),
+            ('https://registry.example.com', 'https://registry.example.com'),
+        ],
+        ids=['host-port-path', 'host', 'host-trailing-slash', 'scheme-path', 'scheme-port-path', 'scheme-host'],
+    )
+    def test_strips_path(self, registry_url, expected):
+        assert _registry_host_url(registry_url) == expected
+
+
+class TestAirflowConfig:
+    @pytest.mark.parametrize('version', ['2.10.5', '3.0.2', '2.9.3'])
+    def test_accepts_version(self, version):
+        assert AirflowConfig.model_validate(VALID_CONFIG | {'version': version}).version == version
+
+    @pytest.mark.parametrize(
+        'version', ['2.10', '2.10.5\n', ' 2.10.5', 'v2.10.5', '10.1.0', '2.100.0', '2.10.5rc1', '']
+    )
+    def test_rejects_version(self, version):
+        with pytest.raises(ValidationError, match='Invalid Airflow version'):
+            AirflowConfig.model_validate(VALID_CONFIG | {'version': version})
+
+    @pytest.mark.parametrize(
+        'repository',
+        ['https://github.com/example/dags.git', 'https://gitlab.example.com:8443/team/airflow-dags.git'],
+    )
+    def test_accepts_dags_repository(self, repository):
+        assert (
+            AirflowConfig.model_validate(VALID_CONFIG | {'dags_repository': repository}).dags_repository == repository
+        )
+
+    @pytest.mark.parametrize(
+        'repository',
+        [
+            'http://github.com/example/dags.git',
+            'git@github.com:example/dags.git',
+            'https://github.com/example/dags',
+            'https://github.com/example/dags.git\n',
+            'https://a.git',
+            'https://github.com/example/dags.git?ref=main',
+        ],
+    )
+    def test_rejects_dags_repository(self, repository):
+        with pytest.raises(ValidationError, match='DAGs repository must be an HTTPS git URL ending with .git'):
+            AirflowConfig.model_validate(VALID_CONFIG | {'dags_repository': repository})
+
+    @pytest.mark.parametrize(
+        'overrides',
+        [
+            {'version': '2.10.5'},
+            {'version': '2.10.5\n'},
+            {'version': '2.1.0.1'},
+            {'dags_repository': 'https://github.com/example/dags.git'},
+            {'dags_repository': 'https://github.com/example/dags.git\n'},
+            {'dags_repository': 'https://github.com/ex ample/dags.git'},
+            {'dags_repository': 'https://short.git'},
+        ],
+    )
+    def test_accepts_same_values_as_field_patterns(self, overrides):
+        assert is_valid(AirflowConfig, **overrides) == is_valid(LegacyAirflowConfig, **overrides)
+
+    def test_factory_rebuilds_config_stored_in_old_format(self, airflow_registered):
+        # Deployment.config holds the JSON dump of the config the deployment was created with
+        stored_config = LegacyAirflowConfig.model_validate(
+            VALID_CONFIG | {'executor': 'KubernetesExecutor', 'node_selector': {'pool': 'workers'}}
+        ).model_dump(mode='json')
+
+        application = ApplicationFactory.get_application(AIRFLOW_APP_ID, stored_config)
+
+        assert isinstance(application, AirflowApplication)
+        assert application._config.model_dump(mode='json') == stored_config
+        assert application.chart_values['executor'] == AirflowExecutor.KubernetesExecutor
+
+
+class TestAirflowResourceValues:
+    def test_returns_independent_copies(self):
+        resource_values = AirflowApplication.get_resource_values()
+        resource_values['workers']['resources']['requests']['cpu'] = '4'
+
+        assert AirflowApplication.get_resource_values()['workers']['resources']['requests']['cpu'] == '200m'
+
+    def test_chart_values_do_not_share_resource_values(self):
+        first = AirflowApplication(AirflowConfig.model_validate(VALID_CONFIG))
+        second = AirflowApplication(AirflowConfig.model_validate(VALID_CONFIG))
+
+        first.chart_values['scheduler']['resources']['requests']['memory'] = '8Gi'
+
+        assert second.chart_values['scheduler']['resources']['requests']['memory'] == '512Mi'
+
+
+class TestAirflowChartValues:
+    def test_chart_values_do_not_alias_the_static_template(self):
+        first = AirflowApplication(AirflowConfig.model_validate(VALID_CONFIG))
+        second = AirflowApplication(AirflowConfig.model_validate(VALID_CONFIG | {'instance_name': 'other'}))
+
+        first.chart_values['images']['airflow'] = {'repository': 'registry.example.com/airflow', 'tag': 'custom'}
+        first.chart_values['logs']['persistence']['size'] = '50Gi'
+        first.chart_values['config']['core']['load_examples'] = True
+
+        assert 'airflow' not in second.chart_values['images']
+        assert second.chart_values['logs']['persistence']['size'] == '10Gi'
+        assert second.chart_values['config']['core']['load_examples'] is False
+        assert second.chart_values['config']['webserver']['instance_name'] == 'other'
+
+    def test_sets_per_instance_values(self):
+        values = AirflowApplication(AirflowConfig.model_validate(VALID_CONFIG | {'flower_enabled': True})).chart_values
+
+        assert values['airflowVersion'] == values['defaultAirflowTag'] == '2.10.5'
+        assert values['flower'] == {'enabled': True}
+        assert values['config']['webserver']['instance_name'] == 'analytics'
+        assert values['dags']['gitSync']['repo'] == VALID_CONFIG['dags_repository']
+        assert values['createUserJob']['env'][0]['valueFrom']['secretKeyRef']['name'] == 'airflow-creds'
@@ -0,0 +1,121 @@
+import re
+
+import pytest
+
+from src.core.apps.airflow_application import AirflowApplication
+from src.core.apps.base_application import AccessEndpoint, AccessEndpointConfig, AccessEndpointType, BaseApplication
+from src.core.apps.grafana_application import GrafanaApplication
+from src.core.apps.prefect_application import PrefectApplication
+from src.core.apps.spark_application import SparkApplication
+from src.core.apps.superset_application import SupersetApplication
+
+APPLICATION_CLASSES = [
+    AirflowApplication,
+    GrafanaApplication,
+    PrefectApplication,
+    SparkApplication,
+    SupersetApplication,
+]
+
+
+def endpoint_config(name, access_type=AccessEndpointType.CLUSTER_IP_PATH, value='/app'):
+    return AccessEndpointConfig(name=name, access_type=access_type, value=value)
+
+
+class TwoRequiredEndpointsApplication(BaseApplication):
+    @classmethod
+    def get_accessible_endpoints(cls):
+        return [
+            AccessEndpoint('web-ui', 'Web UI', AccessEndpointType.CLUSTER_IP_PATH, '/web', required=True),
+            AccessEndpoint('api', 'API', AccessEndpointType.CLUSTER_IP_PATH, '/api', required=True),
+            AccessEndpoint('metrics', 'Metrics', AccessEndpointType.CLUSTER_IP_PATH, '/metrics', required=False),
+        ]
+
+
+class TestMapConfiguredEndpoints:
+    def test_maps_configured_endpoints_by_name(self):
+        web_ui = endpoint_config('web-ui')
+        api = endpoint_config('api')
+
+        configured_map = TwoRequiredEndpointsApplication._map_configured_endpoints([web_ui, api])
+
+        assert configured_map == {'web-ui': web_ui, 'api': api}
+
+    def test_optional_endpoint_may_be_missing(self):
+        configured_map = TwoRequiredEndpointsApplication._map_configured_endpoints(
+            [endpoint_config('web-ui'), endpoint_config('api')]
+        )
+
+        assert 'metrics' not in configured_map
+
+    def test_reports_every_missing_required_endpoint(self):
+        with pytest.raises(ValueError, match=r"^Required endpoint 'web-ui, api' is not configured\.$"):
+            TwoRequiredEndpointsApplication._map_configured_endpoints([endpoint_config('metrics')])
+
+    @pytest.mark.parametrize('application_class', APPLICATION_CLASSES, ids=lambda cls: cls.__name__)
+    def test_applications_share_missing_endpoint_error(self, application_class):
+        application = object.__new__(application_class)
+
+        with pytest.raises(ValueError, match=r"^Required endpoint 'web-ui' is not configured\.$"):
+            application.get_ingress_helm_values([endpoint_config('flower-ui')], '10.0.0.1', 'app-1')
+
+
+class TestValidateSubdomain:
+    @pytest.mark.parametrize(
+        'value',
+        [
+            'airflow.example.com',
+            'Airflow.Example.COM',
+            'my-app.example.com',
+            'app1.example.com',
+            'localhost',
+            # Not valid DNS labels, but accepted by the baseline rules (character set and no '--')
+            '-airflow.example.com',
+            'airflow.example.com-',
+            'airflow.-example.com',
+        ],
+        ids=[
+            'lowercase',
+            'uppercase',
+            'inner-hyphen',
+            'digits',
+            'single-label',
+            'leading-hyphen',
+            'trailing-hyphen',
+            'label-leading-hyphen',
+        ],
+    )
+    def test_accepts_subdomain(self, value):
+        BaseApplication._validate_access_config(endpoint_config('web-ui', AccessEndpointType.SUBDOMAIN, value))
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            '',
+            'air--flow.example.com',
+            'ärflow.example.com',
+            'airflow.exämple.com',
+            'airflow.example.com\n',
+            'airflow_1.example.com',
+            'airflow.example.com/path',
+        ],
+        ids=['empty', 'double-hyphen', 'non-ascii', 'non-ascii-domain', 'trailing-newline', 'underscore', 'path'],
+    )
+    def test_rejects_invalid_subdomain(self, value):
+        with pytest.raises(ValueError, match='Invalid subdomain format for web-ui'):
+            BaseApplication._validate_access_config(endpoint_config('web-ui', AccessEndpointType.SUBDOMAIN, value))
+
+    @pytest.mark.parametrize(
+        'value',
+        ['', 'a', 'A.b-c', '-', '.', '--', 'a--b', 'ä', 'a\n', 'a b', 'a_b', 'a/b', '1.2.3.4', 'x' * 300],
+    )
+    def test_matches_former_pattern(self, value):
+        expected_valid = bool(re.fullmatch(r'[a-zA-Z0-9.-]+', value)) and '--' not in value
+        config = endpoint_config('web-ui', AccessEndpointType.SUBDOMAIN, value)
+
+        try:
+            BaseApplication._validate_access_config(config)
+        except ValueError:
+            assert not expected_valid
+        else:
+            assert expected_valid
@@ -0,0 +1,329 @@
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.api.schemas import DeploymentCreateSchema
+from src.core.apps.base_application import AccessEndpointConfig, AccessEndpointType
+from src.core.deployment_status import DeploymentStatus
+from src.core.kubernetes.cluster_manager import ClusterManager, _create_cluster_manager, get_cluster_manager
+
+WEB_UI = {'name': 'web-ui', 'access_type': 'cluster_ip_path', 'value': '/airflow'}
+FLOWER_UI = {'name': 'flower-ui', 'access_type': 'subdomain', 'value': 'flower.example.com'}
+
+
+@pytest.fixture
+def manager(sqlite_handler):
+    with patch('src.core.kubernetes.cluster_manager.SQLiteHandler', return_value=sqlite_handler):
+        manager = ClusterManager()
+
+    with patch.object(sqlite_handler, 'get_endpoints_for_cluster', wraps=sqlite_handler.get_endpoints_for_cluster):
+        yield manager
+
+
+@pytest.fixture
+def cluster_id(add_cluster):
+    return add_cluster()
+
+
+@pytest.fixture
+def kubernetes_cluster():
+    with patch('src.core.kubernetes.cluster_manager.KubernetesCluster') as kubernetes_cluster_class:
+        cluster = kubernetes_cluster_class.from_db_model.return_value
+        cluster.install_or_upgrade_chart = AsyncMock()
+        cluster.uninstall_chart = AsyncMock()
+        yield cluster
+
+
+@pytest.fixture
+def application_factory():
+    with patch('src.core.kubernetes.cluster_manager.ApplicationFactory') as factory:
+        yield factory
+
+
+def loads(manager):
+    return manager.storage.get_endpoints_for_cluster.call_count
+
+
+class TestEndpointCache:
+    def test_groups_endpoint_values_by_access_type(self, manager, cluster_id, add_deployment):
+        add_deployment(cluster_id, 'airflow', [WEB_UI, FLOWER_UI])
+
+        assert manager.get_existing_endpoints(cluster_id) == {
+            AccessEndpointType.SUBDOMAIN: {'flower.example.com'},
+            AccessEndpointType.DOMAIN_PATH: set(),
+            AccessEndpointType.CLUSTER_IP_PATH: {'/airflow'},
+        }
+
+    def test_repeated_lookups_are_served_from_cache(self, manager, cluster_id, add_deployment):
+        add_deployment(cluster_id, 'airflow', [WEB_UI])
+
+        first = manager.get_existing_endpoints(cluster_id)
+        second = manager.get_existing_endpoints(cluster_id)
+
+        assert second is first
+        assert loads(manager) == 1
+
+    def test_clusters_are_cached_separately(self, manager, add_cluster, add_deployment):
+        first_cluster, second_cluster = add_cluster('first'), add_cluster('second')
+        add_deployment(first_cluster, 'airflow', [WEB_UI])
+
+        manager.get_existing_endpoints(first_cluster)
+        manager.get_existing_endpoints(second_cluster)
+        manager._invalidate_endpoint_cache(second_cluster)
+
+        assert manager.get_existing_endpoints(first_cluster)[AccessEndpointType.CLUSTER_IP_PATH] == {'/airflow'}
+        assert manager.get_existing_endpoints(second_cluster)[AccessEndpointType.CLUSTER_IP_PATH] == set()
+        assert loads(manager) == 3
+
+    def test_unknown_access_type_is_not_cached(self, manager, cluster_id, add_deployment):
+        add_deployment(cluster_id, 'airflow', [{'name': 'web-ui', 'access_type': 'node_port', 'value': '30080'}])
+
+        with pytest.raises(ValueError, match='Unknown access type node_port for endpoint web-ui in deployment airflow'):
+            manager.get_existing_endpoints(cluster_id)
+        assert cluster_id not in manager._endpoint_cache
+
+    def test_create_deployment_entry_invalidates(self, manager, cluster_id):
+        manager.get_existing_endpoints(cluster_id)
+        deployment_create = DeploymentCreateSchema(
+            application_id=1,
+            config={},
+            name='airflow',
+            node_pool='noselection',
+            volumes=None,
+            endpoints=[AccessEndpointConfig(**WEB_UI)],
+        )
+
+        asyncio.run(manager.create_deployment_entry(cluster_id, deployment_create))
+
+        assert '/airflow' in manager.get_existing_endpoints(cluster_id)[AccessEndpointType.CLUSTER_IP_PATH]
+        assert loads(manager) == 2
+
+    def test_update_deployment_invalidates(
+        self, manager, cluster_id, add_deployment, kubernetes_cluster, application_factory
+    ):
+        deployment_id = add_deployment(cluster_id, 'grafana', [WEB_UI], application_id=2)
+        manager.get_existing_endpoints(cluster_id)
+
+        asyncio.run(manager.update_deployment(cluster_id, deployment_id, {'version': '11.6'}))
+
+        kubernetes_cluster.install_or_upgrade_chart.assert_awaited_once()
+        assert cluster_id not in manager._endpoint_cache
+
+    def test_update_deployment_in_other_cluster_is_rejected(self, manager, add_cluster, add_deployment):
+        cluster_id, other_cluster_id = add_cluster('first'), add_cluster('second')
+        deployment_id = add_deployment(cluster_id, 'grafana', [WEB_UI], application_id=2)
+        manager.get_existing_endpoints(other_cluster_id)
+
+        with pytest.raises(ValueError, match=f'Deployment {deployment_id} was not found in cluster {other_cluster_id}'):
+            asyncio.run(manager.update_deployment(other_cluster_id, deployment_id, {}))
+        assert other_cluster_id in manager._endpoint_cache
+
+    def test_remove_deployment_invalidates(
+        self, manager, cluster_id, add_deployment, kubernetes_cluster, application_factory
+    ):
+        deployment_id = add_deployment(cluster_id, 'airflow', [WEB_UI])
+        assert manager.get_existing_endpoints(cluster_id)[AccessEndpointType.CLUSTER_IP_PATH] == {'/airflow'}
+
+        asyncio.run(manager.remove_deployment(deployment_id))
+
+        kubernetes_cluster.uninstall_chart.assert_awaited_once()
+        assert manager.get_existing_endpoints(cluster_id)[AccessEndpointType.CLUSTER_IP_PATH] == set()
+
+    def test_delete_cluster_invalidates(self, manager, cluster_id, add_deployment):
+        add_deployment(cluster_id, 'airflow', [WEB_UI])
+        manager.get_existing_endpoints(cluster_id)
+
+        with patch('src.core.kubernetes.cluster_manager.ProviderFactory'):
+            manager.delete_cluster(cluster_id)
+
+        assert cluster_id not in manager._endpoint_cache
+
+
+class TestEndpointCacheLocking:
+    @pytest.fixture
+    def blocked_load(self, manager):
+        loading, release = threading.Event(), threading.Event()
+        load_endpoints = manager.storage.get_endpoints_for_cluster
+
+        def slow_load(requested_cluster_id):
+            loading.set()
+            release.wait(timeout=5)
+            return load_endpoints(requested_cluster_id)
+
+        with patch.object(manager.storage, 'get_endpoints_for_cluster', side_effect=slow_load):
+            yield loading, release
+
+    def test_invalidation_does_not_wait_for_running_load(self, manager, cluster_id, blocked_load):
+        loading, release = blocked_load
+        loader = threading.Thread(target=manager.get_existing_endpoints, args=(cluster_id,))
+        loader.start()
+        assert loading.wait(timeout=5)
+
+        invalidator = threading.Thread(target=manager._invalidate_endpoint_cache, args=(cluster_id,))
+        invalidator.start()
+        invalidator.join(timeout=1)
+        assert not invalidator.is_alive()
+
+        release.set()
+        loader.join(timeout=5)
+
+        # The load started before the invalidation, so its result must not be cached
+        assert cluster_id not in manager._endpoint_cache
+
+    def test_other_clusters_are_served_during_a_load(self, manager, add_cluster, add_deployment, blocked_load):
+        loading, release = blocked_load
+        slow_cluster, cached_cluster = add_cluster('slow'), add_cluster('cached')
+        add_deployment(cached_cluster, 'airflow', [WEB_UI])
+        release.set()
+        manager.get_existing_endpoints(cached_cluster)
+        release.clear()
+        loading.clear()
+
+        loader = threading.Thread(target=manager.get_existing_endpoints, args=(slow_cluster,))
+        loader.start()
+        assert loading.wait(timeout=5)
+
+        try:
+            assert manager.get_existing_endpoints(cached_cluster)[AccessEndpointType.CLUSTER_IP_PATH] == {'/airflow'}
+        finally:
+            release.set()
+            loader.join(timeout=5)
+
+        assert slow_cluster in manager._endpoint_cache
+
+    def test_concurrent_lookups_agree(self, manager, cluster_id, add_deployment):
+        add_deployment(cluster_id, 'airflow', [WEB_UI])
+        barrier = threading.Barrier(8)
+        results = []
+
+        def lookup():
+            barrier.wait(timeout=5)
+            results.append(manager.get_existing_endpoints(cluster_id))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(results) == 8
+        assert all(result == results[0] for result in results)
+        assert manager.get_existing_endpoints(cluster_id) is manager._endpoint_cache[cluster_id]
+
+    def test_cached_endpoints_are_read_only(self, manager, cluster_id, add_deployment):
+        add_deployment(cluster_id, 'airflow', [WEB_UI])
+
+        existing_endpoints = manager.get_existing_endpoints(cluster_id)
+
+        assert isinstance(existing_endpoints[AccessEndpointType.CLUSTER_IP_PATH], frozenset)
+        with pytest.raises(TypeError):
+            existing_endpoints[AccessEndpointType.SUBDOMAIN] = {'taken.example.com'}
+        with pytest.raises(AttributeError):
+            existing_endpoints[AccessEndpointType.CLUSTER_IP_PATH].add('/other')
+
+
+class TestCreateCluster:
+    @pytest.fixture
+    def cluster_config(self):
+        cluster_config = MagicMock(domain_name='example.com', k3s_version='v1.32.4+k3s1', pools=[])
+        cluster_config.name = 'cluster'
+        cluster_config.additional_components.to_dict.return_value = {}
+        cluster_config.additional_components.traefik_dashboard.enabled = True
+        cluster_config.additional_components.pg_operator.enabled = False
+        return cluster_config
+
+    @pytest.fixture
+    def provider(self):
+        provider = MagicMock()
+        provider.name = 'hetzner'
+        provider._config.to_dict.return_value = {}
+        return provider
+
+    def test_failed_chart_install_cancels_the_other_install(self, manager, provider, cluster_config):
+        certmanager_cancelled = asyncio.Event()
+
+        async def install_longhorn():
+            await asyncio.sleep(0)
+            raise RuntimeError('longhorn install failed')
+
+        async def install_certmanager(domain_name):
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                certmanager_cancelled.set()
+                raise
+
+        cluster = MagicMock(install_longhorn=install_longhorn, install_certmanager=install_certmanager)
+        provider.create_cluster = AsyncMock(return_value=cluster)
+
+        async def create_cluster():
+            await manager.create_cluster(provider, cluster_config)
+            return certmanager_cancelled.is_set()
+
+        assert asyncio.run(asyncio.wait_for(create_cluster(), timeout=5)) is True
+
+        (cluster_from_db,) = manager.storage.get_clusters()
+        assert cluster_from_db.status == DeploymentStatus.FAILED
+        assert cluster_from_db.error_message == 'longhorn install failed'
+        cluster.expose_traefik_dashboard.assert_not_called()
+
+
+class TestGetClusterManager:
+    @pytest.fixture(autouse=True)
+    def fresh_instance(self):
+        _create_cluster_manager.cache_clear()
+        with patch('src.core.kubernetes.cluster_manager.ClusterManager') as cluster_manager_class:
+            yield cluster_manager_class
+        _create_cluster_manager.cache_clear()
+
+    def test_builds_one_shared_instance_on_first_use(self, fresh_instance):
+        fresh_instance.assert_not_called()
+
+        first, second = get_cluster_manager(), get_cluster_manager()
+
+        assert first is second is fresh_instance.return_value
+        fresh_instance.assert_called_once_with()
+
+    def test_concurrent_first_calls_build_one_instance(self, fresh_instance):
+        barrier = threading.Barrier(8)
+
+        def build_slowly():
+            time.sleep(0.05)
+            return MagicMock()
+
+        fresh_instance.side_effect = build_slowly
+        results = []
+
+        def lookup():
+            barrier.wait(timeout=5)
+            results.append(get_cluster_manager())
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+        fresh_instance.assert_called_once_with()
+
+    def test_importing_the_api_does_not_build_it(self):
+        # Run in a fresh interpreter, as other tests may already have imported the API
+        script = (
+            'import src.api.main\n'
+            'from src.core.kubernetes.cluster_manager import _create_cluster_manager\n'
+            'print(_create_cluster_manager.cache_info().currsize)\n'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=Path(__file__).parents[1], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == '0'
+        assert 'ClusterManager initialised' not in result.stderr
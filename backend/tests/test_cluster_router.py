@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import cluster as cluster_router
+from src.api.routers.cluster import get_cluster_manager, router
+
+
+@pytest.fixture
+def fake_cluster_manager():
+    manager = MagicMock()
+    manager.update_deployment = AsyncMock()
+    manager.remove_deployment = AsyncMock()
+    return manager
+
+
+@pytest.fixture
+def client(fake_cluster_manager):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_cluster_manager] = lambda: fake_cluster_manager
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestClusterRouter:
+    def test_update_deployment_passes_integer_ids(self, client, fake_cluster_manager):
+        config = {'version': '2.10.5'}
+
+        response = client.post('/clusters/1/deployments/2', json={'application_id': 1, 'config': config})
+
+        assert response.status_code == 202
+        fake_cluster_manager.update_deployment.assert_awaited_once_with(1, 2, config)
+        cluster_id, deployment_id, _ = fake_cluster_manager.update_deployment.await_args.args
+        assert type(cluster_id) is int
+        assert type(deployment_id) is int
+
+    def test_update_deployment_rejects_non_integer_ids(self, client, fake_cluster_manager):
+        response = client.post('/clusters/abc/deployments/2', json={'application_id': 1, 'config': {}})
+
+        assert response.status_code == 422
+        fake_cluster_manager.update_deployment.assert_not_awaited()
+
+    def test_delete_deployment_passes_integer_id(self, client, fake_cluster_manager):
+        response = client.delete('/clusters/1/deployments/2')
+
+        assert response.status_code == 200
+        fake_cluster_manager.remove_deployment.assert_awaited_once_with(2)
+        assert type(fake_cluster_manager.remove_deployment.await_args.args[0]) is int
+
+
+class TestProxyHealthCheck:
+    @pytest.fixture
+    def app_client(self):
+        from src.api.main import app
+
+        # Not entered as a context manager, so the startup hooks (application registration, periodic tasks) do not run
+        return TestClient(app)
+
+    @pytest.fixture
+    def health_check_get(self):
+        with patch.object(cluster_router._health_check_client, 'get', new_callable=AsyncMock) as mock_get:
+            yield mock_get
+
+    def test_proxies_target_url(self, app_client, health_check_get):
+        target_url = 'http://10.0.0.1/airflow/health'
+        health_check_get.return_value = httpx.Response(200, request=httpx.Request('GET', target_url))
+
+        response = app_client.get('/deployments/proxy-health-check', params={'target_url': target_url})
+
+        assert response.status_code == 200
+        assert response.json() is None
+        health_check_get.assert_awaited_once_with(target_url, follow_redirects=True)
+
+    def test_target_error_status_is_forwarded(self, app_client, health_check_get):
+        target_url = 'http://10.0.0.1/airflow/health'
+        health_check_get.return_value = httpx.Response(503, text='starting', request=httpx.Request('GET', target_url))
+
+        response = app_client.get('/deployments/proxy-health-check', params={'target_url': target_url})
+
+        assert response.status_code == 503
+        assert response.json() == {'detail': 'Target service returned error: starting'}
+
+    def test_missing_target_url_uses_validation_error_envelope(self, app_client, health_check_get):
+        response = app_client.get('/deployments/proxy-health-check')
+
+        assert response.status_code == 422
+        body = response.json()
+        assert body['status_code'] == 10422
+        assert 'target_url' in body['message']
+        assert body['data'] is None
+        health_check_get.assert_not_awaited()
+
+    def test_listed_in_openapi_schema(self, app_client):
+        operation = app_client.get('/openapi.json').json()['paths']['/deployments/proxy-health-check']['get']
+
+        assert operation['parameters'][0]['name'] == 'target_url'
+        assert operation['parameters'][0]['required'] is True
@@ -0,0 +1,20 @@
+from src.core.apps.grafana_application import GrafanaApplication, GrafanaConfig
+
+
+class TestGrafanaChartValues:
+    def test_sets_per_instance_values(self):
+        values = GrafanaApplication(GrafanaConfig(version='11.5', number_of_replicas=2)).chart_values
+
+        assert values['image'] == {'tag': '11.5'}
+        assert values['replicas'] == 2
+        assert values['persistence']['size'] == '10Gi'
+
+    def test_chart_values_do_not_alias_the_static_template(self):
+        first = GrafanaApplication(GrafanaConfig())
+        second = GrafanaApplication(GrafanaConfig())
+
+        first.chart_values['persistence']['size'] = '50Gi'
+        first.chart_values['rbac']['namespaced'] = False
+
+        assert second.chart_values['persistence']['size'] == '10Gi'
+        assert second.chart_values['rbac']['namespaced'] is True
@@ -0,0 +1,76 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+from kubernetes.client.exceptions import ApiException
+from tenacity import stop_after_attempt, wait_fixed
+
+from src.core.kubernetes.kubernetes_cluster import KubernetesCluster
+
+MAX_ATTEMPTS = 3
+
+
+@pytest.fixture
+def kubernetes_client():
+    return MagicMock()
+
+
+@pytest.fixture
+def cluster(kubernetes_client):
+    cluster = KubernetesCluster.__new__(KubernetesCluster)
+    cluster.__dict__['_client'] = kubernetes_client
+    return cluster
+
+
+def wait_for_traefik_crds(cluster):
+    fast_retry = KubernetesCluster.wait_for_traefik_crds.retry_with(
+        stop=stop_after_attempt(MAX_ATTEMPTS), wait=wait_fixed(0)
+    )
+    return asyncio.run(fast_retry(cluster))
+
+
+class TestWaitForTraefikCrds:
+    def test_ready_immediately(self, cluster, kubernetes_client):
+        kubernetes_client.has_resource.return_value = True
+
+        assert wait_for_traefik_crds(cluster) is True
+        assert kubernetes_client.has_resource.call_count == 2
+
+    def test_retries_until_crds_are_registered(self, cluster, kubernetes_client):
+        kubernetes_client.has_resource.side_effect = [False, True, True]
+
+        assert wait_for_traefik_crds(cluster) is True
+
+    def test_returns_false_on_timeout(self, cluster, kubernetes_client):
+        kubernetes_client.has_resource.return_value = False
+
+        assert wait_for_traefik_crds(cluster) is False
+        assert kubernetes_client.has_resource.call_count == MAX_ATTEMPTS
+
+    @pytest.mark.parametrize(
+        'error',
+        [
+            ApiException(status=503, reason='Service Unavailable'),
+            urllib3.exceptions.MaxRetryError(None, '/apis', reason='connection refused'),
+            ConnectionResetError(),
+        ],
+        ids=['api', 'urllib3', 'connection'],
+    )
+    def test_retries_transient_errors(self, cluster, kubernetes_client, error):
+        kubernetes_client.has_resource.side_effect = [error, True, True]
+
+        assert wait_for_traefik_crds(cluster) is True
+
+    def test_returns_false_when_errors_persist(self, cluster, kubernetes_client):
+        kubernetes_client.has_resource.side_effect = ApiException(status=503)
+
+        assert wait_for_traefik_crds(cluster) is False
+        assert kubernetes_client.has_resource.call_count == MAX_ATTEMPTS
+
+    def test_unexpected_errors_are_not_retried(self, cluster, kubernetes_client):
+        kubernetes_client.has_resource.side_effect = ValueError('bad resource')
+
+        with pytest.raises(ValueError, match='bad resource'):
+            wait_for_traefik_crds(cluster)
+        assert kubernetes_client.has_resource.call_count == 1
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.database.handlers.sqlite_handler import SQLiteHandler
+from src.database.models import Cluster
+
+WEB_UI = {'name': 'web-ui', 'access_type': 'cluster_ip_path', 'value': '/airflow'}
+FLOWER_UI = {'name': 'flower-ui', 'access_type': 'subdomain', 'value': 'flower.example.com'}
+UNKNOWN_ACCESS = {'name': 'api', 'access_type': 'node_port', 'value': '30080'}
+
+
+def endpoints_via_orm(sqlite_handler, cluster_id):
+    # What get_existing_endpoints used to build from full deployment rows
+    return [
+        (deployment.name, endpoint['name'], endpoint['access_type'], endpoint['value'])
+        for deployment in sqlite_handler.get_deployments(cluster_id)
+        for endpoint in deployment.endpoints
+    ]
+
+
+class TestGetEndpointsForCluster:
+    def test_matches_orm_rows(self, sqlite_handler, add_cluster, add_deployment):
+        cluster_id, other_cluster_id = add_cluster('first'), add_cluster('second')
+        add_deployment(cluster_id, 'airflow', [WEB_UI, FLOWER_UI])
+        add_deployment(cluster_id, 'empty', [])
+        add_deployment(cluster_id, 'legacy', [UNKNOWN_ACCESS])
+        add_deployment(other_cluster_id, 'grafana', [{'name': 'web-ui', 'access_type': 'domain_path', 'value': 'x/g'}])
+
+        rows = sqlite_handler.get_endpoints_for_cluster(cluster_id)
+
+        assert sorted(rows) == sorted(endpoints_via_orm(sqlite_handler, cluster_id))
+        assert sorted(rows) == [
+            ('airflow', 'flower-ui', 'subdomain', 'flower.example.com'),
+            ('airflow', 'web-ui', 'cluster_ip_path', '/airflow'),
+            ('legacy', 'api', 'node_port', '30080'),
+        ]
+
+    def test_deployments_without_endpoints_yield_no_rows(self, sqlite_handler, add_cluster, add_deployment):
+        cluster_id = add_cluster()
+        add_deployment(cluster_id, 'empty', [])
+
+        assert sqlite_handler.get_endpoints_for_cluster(cluster_id) == []
+        assert endpoints_via_orm(sqlite_handler, cluster_id) == []
+
+    def test_unknown_cluster_yields_no_rows(self, sqlite_handler):
+        assert sqlite_handler.get_endpoints_for_cluster(404) == []
+
+
+class TestReadOnlyEngine:
+    def test_reader_sees_rows_committed_by_writer(self, sqlite_handler, add_cluster):
+        assert sqlite_handler.read_engine is not sqlite_handler.engine
+        # Open a pooled reader connection before the write, so the read is not just a fresh connection
+        assert sqlite_handler.get_clusters() == []
+
+        cluster_id = add_cluster('fresh')
+
+        with sqlite_handler.read_session() as session:
+            assert session.get(Cluster, cluster_id).name == 'fresh'
+        assert sqlite_handler.get_cluster(cluster_id).name == 'fresh'
+
+    def test_reader_cannot_write(self, sqlite_handler):
+        with sqlite_handler.read_session() as session, pytest.raises(OperationalError, match='readonly'):
+            session.execute(text("INSERT INTO application (name, description) VALUES ('x', '')"))
+
+    @pytest.mark.parametrize('db_url', ['sqlite://', 'sqlite:///:memory:'])
+    def test_in_memory_database_reads_through_writer_engine(self, db_url):
+        handler = SQLiteHandler(db_url)
+
+        assert handler.read_engine is handler.engine
+        assert [application.name for application in handler.get_applications()] == ['Airflow', 'Grafana']
@@ -130,6 +130,16 @@ class TestTemplateLoader:
         ):
             template_loader.render_template("simple.txt", values=values)
 
+    def test_render_template_variables_parsed_once(self, template_loader, temp_templates_dir_root):
+        template_loader = TemplateLoader(templates_dir=temp_templates_dir_root)
+        with patch.object(template_loader._environment, 'parse', wraps=template_loader._environment.parse) as parse:
+            assert template_loader.render_template("simple.txt", values={"name": "First"}) == "Hello, First!"
+            assert template_loader.render_template("simple.txt", values={"name": "Second"}) == "Hello, Second!"
+
+        assert parse.call_count == 1
+        with pytest.raises(ValueError, match="not provided in the 'values' dictionary: {'name'}"):
+            template_loader.render_template("simple.txt", values={"another_var": "something"})
+
     def test_render_template_not_found(self, template_loader, temp_templates_dir_root):
         template_loader = TemplateLoader(templates_dir=temp_templates_dir_root)
         with pytest.raises(
@@ -147,39 +157,3 @@ class TestTemplateLoader:
         template_loader = TemplateLoader(templates_dir=temp_templates_dir_root)
         with pytest.raises(TypeError, match="Template values must be a dictionary"):
             template_loader.render_template("simple.txt", values="not_a_dict")
-
-    def test_render_to_temp_file_success(self, template_loader, temp_templates_dir_root):
-        template_loader = TemplateLoader(templates_dir=temp_templates_dir_root)
-        values = {"name": "Test"}
-        temp_file_path = None
-        with template_loader.render_to_temp_file("simple.txt", values=values) as f_path:
-            temp_file_path = f_path
-            assert temp_file_path.is_file()
-            assert temp_file_path.name.startswith("rendered_template_")
-            assert temp_file_path.suffix == ".tmp"
-            assert temp_file_path.read_text() == "Hello, Test!"
-
-        assert not temp_file_path.exists()
-
-    def test_render_to_temp_file_content(self, template_loader, temp_templates_dir_root):
-        template_loader = TemplateLoader(templates_dir=temp_templates_dir_root)
-        values = {"app_name": "another-app"}
-        with template_loader.render_to_temp_file(
-            "deployment.yaml", values=values, template_module="kubernetes"
-        ) as f_path:
-            content = f_path.read_text()
-            assert "name: another-app" in content
-
-    def test_render_to_temp_file_template_not_found(self, template_loader, temp_templates_dir_root):
-        template_loader = TemplateLoader(templates_dir=temp_templates_dir_root)
-        values = {"name": "Test"}
-        with pytest.raises(TemplateNotFound):
-            with template_loader.render_to_temp_file("non_existent.txt", values=values):
-                pass
-
-    def test_render_to_temp_file_missing_variables(self, template_loader, temp_templates_dir_root):
-        template_loader = TemplateLoader(templates_dir=temp_templates_dir_root)
-        values = {"wrong_var": "value"}
-        with pytest.raises(ValueError, match="There are variables in the template './/simple.txt' that are not provided in the 'values' dictionary: {'name'}"):
-            with template_loader.render_to_temp_file("simple.txt", values=values):
-                pass
\ No newline at end of file
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.core import utils
+from src.core.utils import get_github_release_tags
+
+REPOSITORY = 'apache/airflow'
+
+
+def make_response(status_code, json_body=None, headers=None):
+    request = httpx.Request('GET', f'https://api.github.com/repos/{REPOSITORY}/releases')
+    return httpx.Response(status_code, json=json_body, headers=headers, request=request)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    with patch.object(utils, '_GITHUB_CACHE_DIR', tmp_path / 'github'):
+        yield tmp_path / 'github'
+
+
+@pytest.fixture
+def github_get():
+    with patch.object(utils._github_client, 'get', new_callable=AsyncMock) as mock_get:
+        yield mock_get
+
+
+def cache_files(cache_dir):
+    return sorted(cache_dir.iterdir()) if cache_dir.exists() else []
+
+
+def write_cache(cache_dir, etag, tags, age_seconds=0):
+    asyncio.run(fetch_tags_with(make_response(200, [{'tag_name': tag} for tag in tags], {'ETag': etag})))
+    (cache_file,) = cache_files(cache_dir)
+    mtime = time.time() - age_seconds
+    os.utime(cache_file, (mtime, mtime))
+    return cache_file
+
+
+async def fetch_tags_with(response):
+    with patch.object(utils._github_client, 'get', new_callable=AsyncMock, return_value=response):
+        return await get_github_release_tags(REPOSITORY)
+
+
+class TestGetGithubReleaseTags:
+    def test_miss_fetches_and_caches_tags(self, cache_dir, github_get):
+        github_get.return_value = make_response(200, [{'tag_name': '1.0.0'}, {'tag_name': '0.9.0'}], {'ETag': '"v1"'})
+
+        tags = asyncio.run(get_github_release_tags(REPOSITORY))
+
+        assert tags == ['1.0.0', '0.9.0']
+        assert github_get.await_args.kwargs['headers'] == {}
+        (cache_file,) = cache_files(cache_dir)
+        assert json.loads(cache_file.read_text()) == {'etag': '"v1"', 'tags': ['1.0.0', '0.9.0']}
+
+    def test_fresh_hit_skips_request(self, cache_dir, github_get):
+        write_cache(cache_dir, '"v1"', ['1.0.0'])
+
+        tags = asyncio.run(get_github_release_tags(REPOSITORY))
+
+        assert tags == ['1.0.0']
+        github_get.assert_not_awaited()
+
+    def test_stale_entry_not_modified_reuses_cached_tags(self, cache_dir, github_get):
+        cache_file = write_cache(cache_dir, '"v1"', ['1.0.0'], age_seconds=utils._GITHUB_CACHE_TTL_SECONDS + 60)
+        github_get.return_value = make_response(304)
+
+        tags = asyncio.run(get_github_release_tags(REPOSITORY))
+
+        assert tags == ['1.0.0']
+        assert github_get.await_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+        assert time.time() - cache_file.stat().st_mtime < utils._GITHUB_CACHE_TTL_SECONDS
+
+    def test_stale_entry_refreshed_on_new_release(self, cache_dir, github_get):
+        cache_file = write_cache(cache_dir, '"v1"', ['1.0.0'], age_seconds=utils._GITHUB_CACHE_TTL_SECONDS + 60)
+        github_get.return_value = make_response(200, [{'tag_name': '1.1.0'}, {'tag_name': '1.0.0'}], {'ETag': '"v2"'})
+
+        tags = asyncio.run(get_github_release_tags(REPOSITORY))
+
+        assert tags == ['1.1.0', '1.0.0']
+        assert json.loads(cache_file.read_text()) == {'etag': '"v2"', 'tags': ['1.1.0', '1.0.0']}
+
+    @pytest.mark.parametrize('content', ['{"etag": "\\"v1\\"", "tags": [', '{"etag": "\\"v1\\""}', '["1.0.0"]', ''])
+    def test_corrupt_entry_is_treated_as_miss(self, cache_dir, github_get, content):
+        cache_file = write_cache(cache_dir, '"v1"', ['1.0.0'])
+        cache_file.write_text(content)
+        github_get.return_value = make_response(200, [{'tag_name': '1.0.0'}], {'ETag': '"v2"'})
+
+        tags = asyncio.run(get_github_release_tags(REPOSITORY))
+
+        assert tags == ['1.0.0']
+        assert github_get.await_args.kwargs['headers'] == {}
+        assert json.loads(cache_file.read_text()) == {'etag': '"v2"', 'tags': ['1.0.0']}
+        assert cache_files(cache_dir) == [cache_file]